@@ -15,6 +15,11 @@ from pathlib import Path
 #   - Note: tricolor and grayscale are mutually exclusive
 #   - If both are False, display receives B&W data
 #   - Grayscale displays can also receive B&W data (set grayscale: False)
+#   - dither: True to Floyd-Steinberg dither instead of hard thresholding
+#     (better for photos/newspaper, worse for crisp text), or 'bayer' for
+#     a faster ordered dither with a regular cross-hatch look. Default: False
+#   - compress: True to gzip uploads (typically 3-8x smaller, so less WiFi
+#     air time). Needs MicroPython 1.21+ on the Pico. Default: False
 #
 
 displays = {
@@ -154,6 +159,8 @@ schedule = {
 server_config = {
     'output_dir': Path('output'),
     'log_level': 'INFO',
+    'debug': False,  # Save each update's image/binary to output_dir
+    'resample': 'bilinear',  # Filter for resizing wrongly sized plugin output
 }
 
 
@@ -163,15 +170,15 @@ server_config = {
 
 def validate_config():
     """Validate configuration"""
-    # Check all scheduled displays exist
-    for display_name in schedule.keys():
-        if display_name not in displays:
-            raise ValueError(f"Display '{display_name}' in schedule but not defined")
+    display_names = frozenset(displays)
+    plugin_names = frozenset(plugins)
 
-    # Check all scheduled plugins exist
+    # Check all scheduled displays and plugins exist (single pass)
     for display_name, plugin_list in schedule.items():
+        if display_name not in display_names:
+            raise ValueError(f"Display '{display_name}' in schedule but not defined")
         for plugin_name, _ in plugin_list:
-            if plugin_name not in plugins:
+            if plugin_name not in plugin_names:
                 raise ValueError(f"Plugin '{plugin_name}' in schedule but not defined")
 
     # Check tricolor and grayscale are mutually exclusive
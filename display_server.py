@@ -6,14 +6,25 @@ Manages multiple displays and content plugins
 
 import time
 import logging
+import functools
+import hashlib
 import importlib
-import schedule
+import os
+import re
+from collections import OrderedDict
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
-import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple, Union, TYPE_CHECKING
 from datetime import datetime
 
+# NumPy, PIL, requests and schedule are imported where they are used so
+# that importing this module (config checks, status queries) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,12 +32,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# PIL resampling filters accepted for the resize fallback
+_RESAMPLE_FILTERS = ('nearest', 'box', 'bilinear', 'hamming', 'bicubic', 'lanczos')
+
+# Accepted Display.dither values: True is Floyd-Steinberg error diffusion
+_DITHER_MODES = (False, True, 'floyd-steinberg', 'bayer')
+
+# Brightness -> 2-bit gray level: >192 white (0), >128 light gray (1),
+# >64 dark gray (2), else black (3)
+_GRAY_LUT = [3] * 65 + [2] * 64 + [1] * 64 + [0] * 63
+# Placeholder palette that lets a 2-bit level image use PIL's 'P;2' packer
+_GRAY_RAW_PALETTE = bytes(768)
+
+
+# Schedule strings: "[every] N minutes|hours" or "daily at HH:MM"
+_SCHEDULE_RE = re.compile(
+    r'(?:every\s+)?(?P<count>\d+)\s+(?P<unit>minute|hour)s?'
+    r'|daily\s+at\s+(?P<time>\d\d:\d\d)',
+    re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_interval(interval: str) -> Optional[Tuple[str, Any]]:
+    """
+    Parse a schedule string into (kind, value)
+
+    Args:
+        interval: Schedule string (e.g., "every 10 minutes", "2 hours", "daily at 06:00")
+
+    Returns:
+        ('minutes', int), ('hours', int), ('daily', "HH:MM") or None if unknown
+    """
+    match = _SCHEDULE_RE.fullmatch(interval.strip())
+    if match is None:
+        return None
+    if match['time']:
+        return 'daily', match['time']
+    return match['unit'].lower() + 's', int(match['count'])
+
+
+def _as_rgb(image: 'Image.Image') -> 'Image.Image':
+    """The image in RGB mode, skipping the copy convert() makes if it already is"""
+    return image if image.mode == 'RGB' else image.convert('RGB')
+
+
+def _gray_palette() -> 'Image.Image':
+    """Palette image with the 4 panel gray levels, indexed white (0) to black (3)"""
+    from PIL import Image
+
+    palette = Image.new('P', (1, 1))
+    palette.putpalette([255, 255, 255, 170, 170, 170, 85, 85, 85, 0, 0, 0])
+    return palette
+
+
+@functools.lru_cache(maxsize=8)
+def _bayer_index(height: int, width: int) -> 'np.ndarray':
+    """8x8 Bayer matrix (ranks 0..63) tiled over a height x width image"""
+    import numpy as np
+
+    matrix = np.zeros((1, 1), dtype=np.uint8)
+    for _ in range(3):
+        matrix = np.block([[4 * matrix, 4 * matrix + 2], [4 * matrix + 3, 4 * matrix + 1]])
+    tiled = np.tile(matrix, (-(-height // 8), -(-width // 8)))[:height, :width]
+    tiled.flags.writeable = False
+    return tiled
+
+
+# Held while resolving and running the Numba kernels: the default
+# threading layer can't run parallel kernels from several threads at once
+_JIT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernels() -> Optional[Dict[str, Callable]]:
+    """
+    Numba-compiled packing kernels (see pack_kernels), or None if Numba
+    isn't installed, in which case the NumPy paths are used
+    """
+    try:
+        from numba import config
+        import pack_kernels
+    except ImportError:
+        return None
+    # TBB, Numba's first choice when installed, can hang interpreter exit once
+    # a kernel has run on a worker thread. _JIT_LOCK runs the kernels one at
+    # a time, so the built-in workqueue layer is safe to use.
+    if 'NUMBA_THREADING_LAYER' not in os.environ:
+        config.THREADING_LAYER = 'workqueue'
+    return {'bw': pack_kernels.pack_bw, 'bwr': pack_kernels.pack_bwr}
+
 
 class Display:
     """Represents a physical e-ink display"""
 
     def __init__(self, name: str, ip: str, port: int, width: int, height: int,
-                 tricolor: bool = False, grayscale: bool = False):
+                 tricolor: bool = False, grayscale: bool = False,
+                 dither: Union[bool, str] = False, compress: bool = False):
         self.name = name
         self.ip = ip
         self.port = port
@@ -34,25 +135,48 @@ class Display:
         self.height = height
         self.tricolor = tricolor
         self.grayscale = grayscale
+        self.dither = dither
+        # gzip the upload (firmware inflates it; needs MicroPython 1.21+)
+        self.compress = compress
         self.last_update = None
+        # Held for a whole update so jobs for the same display never overlap
+        self.lock = threading.Lock()
+        # Image -> display bytes converter, bound by DisplayServer.register_display
+        self.to_binary: Optional[Callable[['Image.Image'], bytearray]] = None
+        # Fixed-shape NumPy work arrays reused by the converter, allocated on first use
+        self.scratch: Dict[Tuple[str, Tuple[int, ...]], Any] = {}
 
         # Validate: tricolor and grayscale are mutually exclusive
         if tricolor and grayscale:
             raise ValueError(f"Display {name}: tricolor and grayscale are mutually exclusive")
+        if dither not in _DITHER_MODES:
+            raise ValueError(f"Display {name}: unknown dither mode {dither!r}")
 
-    def __repr__(self):
-        if self.tricolor:
-            colors = "BWR"
-        elif self.grayscale:
-            colors = "GRAY"
+        # Color mode label, fixed for the lifetime of the display
+        if tricolor:
+            self.mode = "BWR"
+        elif grayscale:
+            self.mode = "GRAY"
         else:
-            colors = "BW"
-        return f"Display({self.name}, {self.width}x{self.height} {colors} @ {self.ip})"
+            self.mode = "BW"
+
+        # Bytes per full-screen update, as the firmware expects them
+        if grayscale:
+            self.binary_size = height * ((width + 3) // 4)
+        else:
+            self.binary_size = (2 if tricolor else 1) * height * ((width + 7) // 8)
+
+    def __repr__(self):
+        return f"Display({self.name}, {self.width}x{self.height} {self.mode} @ {self.ip})"
 
 
 class UpdateRecord:
     """Tracks update history for a display"""
 
+    __slots__ = ('last_attempt', 'last_success', 'last_error', 'last_error_message',
+                 'success_count', 'error_count',
+                 '_last_attempt_iso', '_last_success_iso', '_last_error_iso')
+
     def __init__(self):
         self.last_attempt: Optional[datetime] = None
         self.last_success: Optional[datetime] = None
@@ -60,12 +184,17 @@ class UpdateRecord:
         self.last_error_message: Optional[str] = None
         self.success_count: int = 0
         self.error_count: int = 0
+        # ISO strings are formatted once per event, not on every status query
+        self._last_attempt_iso: Optional[str] = None
+        self._last_success_iso: Optional[str] = None
+        self._last_error_iso: Optional[str] = None
 
     def record_success(self):
         """Record a successful update"""
         now = datetime.now()
         self.last_attempt = now
         self.last_success = now
+        self._last_attempt_iso = self._last_success_iso = now.isoformat()
         self.success_count += 1
 
     def record_error(self, error_message: str):
@@ -73,31 +202,155 @@ class UpdateRecord:
         now = datetime.now()
         self.last_attempt = now
         self.last_error = now
+        self._last_attempt_iso = self._last_error_iso = now.isoformat()
         self.last_error_message = error_message
         self.error_count += 1
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         return {
-            'last_attempt': self.last_attempt.isoformat() if self.last_attempt else None,
-            'last_success': self.last_success.isoformat() if self.last_success else None,
-            'last_error': self.last_error.isoformat() if self.last_error else None,
+            'last_attempt': self._last_attempt_iso,
+            'last_success': self._last_success_iso,
+            'last_error': self._last_error_iso,
             'last_error_message': self.last_error_message,
             'success_count': self.success_count,
             'error_count': self.error_count
         }
 
 
+class _LazyPlugin:
+    """
+    Defers importing and constructing a plugin until it is first used
+
+    Attribute access (get_name, should_update, generate, ...) is forwarded
+    to the real plugin, which is created on first access. Plugins are not
+    written to be thread-safe, so callers hold `lock` while using one.
+    """
+
+    def __init__(self, name: str, plugin_class: str, config: Dict):
+        self._name = name
+        self._plugin_class = plugin_class
+        self._config = config
+        self._plugin = None
+        self.lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._plugin is not None
+
+    def _load(self):
+        with self.lock:
+            if self._plugin is not None:
+                return self._plugin
+
+            # Import plugin module and class
+            module_path, class_name = self._plugin_class.rsplit('.', 1)
+            module = importlib.import_module(module_path)
+            plugin_cls = getattr(module, class_name)
+
+            # Instantiate plugin
+            self._plugin = plugin_cls(self._config)
+            logger.info(f"Loaded plugin: {self._name} ({self._plugin.get_name()})")
+            return self._plugin
+
+    def __getattr__(self, attr: str):
+        plugin = self._plugin or self._load()
+        return getattr(plugin, attr)
+
+    def cleanup(self):
+        # Nothing to clean up if the plugin was never used
+        if self._plugin is not None:
+            self._plugin.cleanup()
+
+
+class _StreamedBody:
+    """
+    HTTP request body produced chunk by chunk, with a known length
+
+    Having __len__ lets requests send a Content-Length header instead of
+    chunked encoding (the Pico firmware needs Content-Length). Chunks are
+    recorded as they are sent, so the body can be iterated again (retries)
+    and the complete data recovered with getvalue().
+    """
+
+    def __init__(self, chunks: Iterator[bytes], length: int):
+        self._chunks = chunks
+        self._length = length
+        self._data = bytearray()
+        self._done = False
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Replay whatever was produced by an earlier attempt, then continue
+        if self._data:
+            yield bytes(self._data)
+        for chunk in self._chunks:
+            self._data += chunk
+            yield chunk
+        self._done = True
+
+    def getvalue(self) -> bytearray:
+        """Complete data, finishing any chunks that were not sent"""
+        if not self._done:
+            for chunk in self._chunks:
+                self._data += chunk
+            self._done = True
+        return self._data
+
+
 class DisplayServer:
     """
     Main display server
     Manages displays and routes content from plugins
     """
 
-    def __init__(self, output_dir: Path = None):
+    # Number of converted images kept for reuse across all displays
+    BINARY_CACHE_SIZE = 8
+
+    # Approximate size of each converted band when streaming an upload
+    STREAM_CHUNK_BYTES = 4096
+
+    _POST_HEADERS = {'Content-Type': 'application/octet-stream'}
+    _GZIP_POST_HEADERS = {**_POST_HEADERS, 'Content-Encoding': 'gzip'}
+
+    # Longest the scheduler sleeps in one go. Jobs are timed off the wall
+    # clock, which can jump (NTP sync after a Pi boots), so re-check it
+    # now and then rather than trusting one long sleep.
+    MAX_IDLE_SECONDS = 900
+
+    # DEFLATE level for compressed uploads; 1-bit planes are mostly long
+    # runs, so higher levels barely shrink them further
+    GZIP_LEVEL = 6
+
+    def __init__(self, output_dir: Path = None, debug: bool = False,
+                 resample: str = 'bilinear'):
+        if resample.lower() not in _RESAMPLE_FILTERS:
+            raise ValueError(f"Unknown resample filter: {resample} "
+                             f"(expected one of {', '.join(_RESAMPLE_FILTERS)})")
         self.displays: Dict[str, Display] = {}
-        self.plugins: Dict[str, Any] = {}
+        self.plugins: Dict[str, _LazyPlugin] = {}
         self.update_history: Dict[str, UpdateRecord] = {}
+        self.last_image_hash: Dict[str, str] = {}
+        # Recent conversions keyed by (display, image hash), least recent first
+        self._binary_cache: "OrderedDict[Tuple[str, str], bytearray]" = OrderedDict()
+        self._session = None
+        # Runs scheduled updates so displays due together update in parallel
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Guards state shared between update threads: the binary cache and
+        # the lazily created session, executor and debug writer
+        self._lock = threading.Lock()
+        # Debug PNG/.bin dumps are only written when asked for (or DEBUG
+        # logging is on), and then by a background thread so they stay off
+        # the update path
+        self.debug = debug or logger.isEnabledFor(logging.DEBUG)
+        self._debug_queue: Optional[queue.Queue] = None
+        # Set by schedule_update() to wake run() early for a new job
+        self._schedule_changed = threading.Event()
+        # Filter for resizing wrongly sized plugin output; the result is
+        # thresholded to 1-2 bits, so bilinear looks the same as lanczos
+        self.resample = resample.lower()
         self.output_dir = output_dir or Path(__file__).parent / "output"
         self.output_dir.mkdir(exist_ok=True)
 
@@ -107,39 +360,72 @@ class DisplayServer:
     
     def register_display(self, name: str, ip: str, port: int,
                         width: int, height: int, tricolor: bool = False,
-                        grayscale: bool = False):
+                        grayscale: bool = False, dither: Union[bool, str] = False,
+                        compress: bool = False):
         """Register a display"""
-        display = Display(name, ip, port, width, height, tricolor, grayscale)
+        display = Display(name, ip, port, width, height, tricolor, grayscale, dither,
+                          compress)
+        # Pick the converter once so updates don't re-check the color mode.
+        # Work arrays are reused per display (scratch), but each result gets
+        # a fresh buffer: it outlives the call in the binary cache and while
+        # a streamed upload is in flight.
+        if grayscale:
+            display.to_binary = functools.partial(self.convert_to_grayscale, dither=dither)
+        else:
+            display.to_binary = functools.partial(self.convert_to_binary, tricolor=tricolor,
+                                                  dither=dither, scratch=display.scratch)
         self.displays[name] = display
         self.update_history[name] = UpdateRecord()
         logger.info(f"Registered display: {display}")
     
+    def _get_session(self):
+        """Shared HTTP session, created on first use so its pool fits all displays"""
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # Retry refused or dropped connections only: a display that
+                # accepted but doesn't answer is busy or hung, and retrying it
+                # would multiply the caller's timeout and surface as a
+                # ConnectionError instead of a Timeout
+                adapter = HTTPAdapter(pool_connections=len(self.displays) + 4,
+                                      pool_maxsize=len(self.displays) + 4,
+                                      max_retries=Retry(total=2, read=False,
+                                                        backoff_factor=0.3))
+                self._session = requests.Session()
+                self._session.mount('http://', adapter)
+            return self._session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Update worker pool, created on first use with a thread per display"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=len(self.displays) or 4,
+                                                    thread_name_prefix="update")
+            return self._executor
+    
     def load_plugin(self, name: str, plugin_class: str, config: Dict = None):
         """
         Load a content plugin
+
+        The plugin module is imported and instantiated on first use, so
+        plugins that are configured but never scheduled cost nothing.
         
         Args:
             name: Plugin instance name
             plugin_class: Python path to plugin class (e.g., 'plugins.weather.WeatherPlugin')
             config: Plugin configuration dictionary
         """
-        try:
-            # Import plugin module and class
-            module_path, class_name = plugin_class.rsplit('.', 1)
-            module = importlib.import_module(module_path)
-            plugin_cls = getattr(module, class_name)
-            
-            # Instantiate plugin
-            plugin = plugin_cls(config or {})
-            self.plugins[name] = plugin
-            
-            logger.info(f"Loaded plugin: {name} ({plugin.get_name()})")
-            
-        except Exception as e:
-            logger.error(f"Failed to load plugin {name}: {e}")
-            raise
+        if '.' not in plugin_class:
+            logger.error(f"Failed to load plugin {name}: invalid class path {plugin_class!r}")
+            raise ValueError(f"Invalid plugin class path: {plugin_class}")
+        
+        self.plugins[name] = _LazyPlugin(name, plugin_class, config or {})
+        logger.info(f"Registered plugin: {name} ({plugin_class})")
     
-    def generate_content(self, plugin_name: str, display_name: str) -> Optional[Image.Image]:
+    def generate_content(self, plugin_name: str, display_name: str) -> Optional[Union['Image.Image', bytes]]:
         """
         Generate content from plugin for specific display
         
@@ -148,7 +434,8 @@ class DisplayServer:
             display_name: Name of display (for sizing)
             
         Returns:
-            PIL Image or None if failed
+            PIL Image, display-ready bytes from a plugin's generate_packed()
+            (see plugins.base.PackedPlugin), or None if failed
         """
         if plugin_name not in self.plugins:
             logger.error(f"Plugin not found: {plugin_name}")
@@ -164,24 +451,42 @@ class DisplayServer:
         try:
             logger.info(f"[{display.name}] Generating content from {plugin_name}...")
             
-            # Check if update needed
-            if not plugin.should_update():
-                logger.info(f"[{display.name}] Plugin says no update needed")
-                return None
-            
-            # Generate content
-            image = plugin.generate(display.width, display.height, display.tricolor,
-                                    display.grayscale)
+            # One display at a time per plugin: plugins keep state between
+            # should_update() and generate() and aren't thread-safe
+            with plugin.lock:
+                # Check if update needed
+                if not plugin.should_update():
+                    logger.info(f"[{display.name}] Plugin says no update needed")
+                    return None
+                
+                # Plugins that draw straight into the display format skip
+                # the image and its conversion
+                if hasattr(plugin, 'generate_packed'):
+                    packed = plugin.generate_packed(display.width, display.height,
+                                                    display.tricolor, display.grayscale)
+                    if packed is not None:
+                        if len(packed) == display.binary_size:
+                            return packed
+                        logger.warning(f"Plugin returned {len(packed)} packed bytes, expected "
+                                       f"{display.binary_size}; using generate() instead")
+                
+                # Generate content
+                image = plugin.generate(display.width, display.height, display.tricolor,
+                                        display.grayscale)
             
             if image.size != (display.width, display.height):
                 logger.warning(f"Plugin returned wrong size: {image.size}, expected {display.width}x{display.height}")
                 logger.info("Resizing image...")
-                image = image.resize((display.width, display.height), Image.LANCZOS)
+                from PIL import Image
+                # Lets JPEGs that aren't loaded yet decode at reduced scale
+                image.draft('RGB', (display.width, display.height))
+                image = image.resize((display.width, display.height),
+                                     Image.Resampling[self.resample.upper()])
             
             # Save for debugging
-            debug_path = self.output_dir / f"{display.name}_{plugin_name}.png"
-            image.save(debug_path)
-            logger.info(f"[{display.name}] Saved debug image: {debug_path}")
+            if self.debug:
+                debug_path = self.output_dir / f"{display.name}_{plugin_name}.png"
+                self._write_debug_file(debug_path, image.copy())
             
             return image
             
@@ -189,108 +494,235 @@ class DisplayServer:
             logger.error(f"[{display.name}] Error generating content: {e}", exc_info=True)
             return None
     
-    def convert_to_binary(self, image: Image.Image, tricolor: bool = False) -> bytes:
+    def convert_to_binary(self, image: 'Image.Image', tricolor: bool = False,
+                          dither: Union[bool, str] = False,
+                          scratch: Optional[Dict[str, Any]] = None) -> bytearray:
         """
         Convert PIL image to binary format for e-ink display
         
         Args:
-            image: PIL Image (RGB mode)
+            image: PIL Image (RGB; '1' and 'L' skip the RGB expansion)
             tricolor: True to generate B/W/R data, False for B/W only
+            dither: True to Floyd-Steinberg dither the black plane
+                    instead of hard thresholding (better for photos),
+                    'bayer' for a faster ordered dither
+            scratch: Optional dict of work arrays reused between calls
+                     (see Display.scratch)
             
         Returns:
             Binary data ready to send to display
         """
-        width, height = image.size
-        pixels = image.load()
-        
+        import numpy as np
+
+        if image.mode in ('1', 'L'):
+            # Single-channel images hold no red, so classify them directly
+            # rather than expanding to three channels first
+            return self._convert_mono(image, tricolor, dither)
+
+        arr = np.asarray(_as_rgb(image), dtype=np.uint8)
+
+        # Thresholded conversion: when Numba is available, classify and
+        # pack all planes in one compiled pass straight into the output
+        if not dither:
+            with _JIT_LOCK:
+                kernels = _jit_kernels()
+                if kernels is not None:
+                    height, width = arr.shape[:2]
+                    planes = 2 if tricolor else 1
+                    out = bytearray(planes * height * ((width + 7) // 8))
+                    kernels['bwr' if tricolor else 'bw'](arr, np.frombuffer(out, dtype=np.uint8))
+                    return out
+
+        is_black, is_red = self._color_masks(arr, tricolor, dither, scratch)
+        if is_red is not None:
+            # Two planes: black/white followed by red
+            return self._pack_bits(is_black, is_red)
+
+        # Black and white only
+        return self._pack_bits(is_black)
+
+    def _convert_mono(self, image: 'Image.Image', tricolor: bool,
+                      dither: Union[bool, str]) -> bytearray:
+        """
+        convert_to_binary for '1' and 'L' images
+
+        Gives the same bytes as converting to RGB first: '1' pixels are
+        black or white already, 'L' pixels are black below 60, and the red
+        plane of a tricolor display is left empty.
+        """
+        import numpy as np
+        from PIL import Image
+
+        if image.mode == '1':
+            is_black = ~np.asarray(image)
+        elif dither == 'bayer':
+            is_black = self._ordered_dither(np.asarray(image))
+        elif dither:
+            is_black = ~np.asarray(image.convert('1', dither=Image.Dither.FLOYDSTEINBERG))
+        else:
+            is_black = np.asarray(image) < 60
+
         if tricolor:
-            # Create two buffers: black/white + red
-            black_buffer = []
-            red_buffer = []
-            
-            for y in range(height):
-                for x in range(0, width, 8):
-                    black_byte = 0
-                    red_byte = 0
-                    
-                    for bit in range(8):
-                        if x + bit < width:
-                            r, g, b = pixels[x + bit, y]
-                            
-                            # Detect red
-                            is_red = (r > 150 and r > g * 1.5 and r > b * 1.5)
-                            
-                            # Detect black
-                            is_black = (r < 60 and g < 60 and b < 60)
-                            
-                            if is_black:
-                                black_byte |= (1 << (7 - bit))
-                            elif is_red:
-                                red_byte |= (1 << (7 - bit))
-                    
-                    black_buffer.append(black_byte)
-                    red_buffer.append(red_byte)
-            
-            return bytes(black_buffer + red_buffer)
-        
+            return self._pack_bits(is_black, np.zeros_like(is_black))
+        return self._pack_bits(is_black)
+
+    def _color_masks(self, arr: 'np.ndarray', tricolor: bool, dither: Union[bool, str],
+                     scratch: Optional[Dict[str, Any]]) -> Tuple['np.ndarray', Optional['np.ndarray']]:
+        """
+        Classify an RGB array into black and (for tricolor) red pixel masks
+
+        Both masks come from the same array in one function, and black
+        takes precedence over red.
+
+        Returns:
+            (is_black, is_red), where is_red is None unless tricolor
+        """
+        import numpy as np
+        from PIL import Image
+
+        r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
+        shape = arr.shape[:2]
+        mask = self._scratch(scratch, 'mask', shape, np.bool_)
+
+        if tricolor:
+            # Detect red: r > 1.5*g and r > 1.5*b, kept in integer math
+            # (2r > 3g) so NumPy uses its vectorized uint16 compares
+            r2 = self._scratch(scratch, 'r2', shape, np.uint16)
+            c3 = self._scratch(scratch, 'c3', shape, np.uint16)
+            is_red = self._scratch(scratch, 'red', shape, np.bool_)
+            np.multiply(r, 2, out=r2, dtype=np.uint16)
+            np.greater(r, 150, out=is_red)
+            np.multiply(g, 3, out=c3, dtype=np.uint16)
+            is_red &= np.greater(r2, c3, out=mask)
+            np.multiply(b, 3, out=c3, dtype=np.uint16)
+            is_red &= np.greater(r2, c3, out=mask)
+
+        if dither:
+            # Let PIL diffuse the error; red pixels are blanked to white
+            # first so they don't bleed into the black plane
+            if tricolor:
+                rgb = arr.copy()
+                rgb[is_red] = 255
+                source = Image.fromarray(rgb, 'RGB')
+            else:
+                source = Image.fromarray(arr, 'RGB')
+            if dither == 'bayer':
+                is_black = self._ordered_dither(np.asarray(source.convert('L')))
+            else:
+                bw = source.convert('1', dither=Image.Dither.FLOYDSTEINBERG)
+                is_black = ~np.asarray(bw)
         else:
-            # Black and white only
-            buffer = []
-            
-            for y in range(height):
-                for x in range(0, width, 8):
-                    byte = 0
-                    
-                    for bit in range(8):
-                        if x + bit < width:
-                            r, g, b = pixels[x + bit, y]
-                            
-                            # Black if dark
-                            is_black = (r < 60 and g < 60 and b < 60)
-                            
-                            if is_black:
-                                byte |= (1 << (7 - bit))
-                    
-                    buffer.append(byte)
-            
-            return bytes(buffer)
+            # Black if dark
+            is_black = self._scratch(scratch, 'black', shape, np.bool_)
+            np.less(r, 60, out=is_black)
+            is_black &= np.less(g, 60, out=mask)
+            is_black &= np.less(b, 60, out=mask)
+
+        if not tricolor:
+            return is_black, None
 
-    def convert_to_grayscale(self, image: Image.Image) -> bytes:
+        # Black takes precedence over red
+        is_red &= np.logical_not(is_black, out=mask)
+        return is_black, is_red
+
+    @staticmethod
+    def _ordered_dither(luma: 'np.ndarray') -> 'np.ndarray':
+        """
+        Black mask of an 8-bit luminance array by 8x8 Bayer ordered dither
+
+        Each pixel is compared against its cell of the tiled matrix, so
+        unlike error diffusion it is one vectorized compare.
+        """
+        import numpy as np
+
+        # Ranks 0..63 -> thresholds 2..254, centred in each 1/64 step
+        thresholds = _bayer_index(*luma.shape) * np.uint8(4) + np.uint8(2)
+        return luma < thresholds
+
+    @staticmethod
+    def _scratch(scratch: Optional[Dict[str, Any]], name: str, shape: Tuple[int, ...],
+                 dtype) -> 'np.ndarray':
+        """
+        Work array for a conversion, reused across updates when possible
+
+        Args:
+            scratch: A display's scratch dict, or None to always allocate
+            name: Buffer name within the dict
+            shape: Required array shape
+            dtype: Required NumPy dtype
+        """
+        import numpy as np
+
+        # Keyed by shape too, so full images and streamed bands each keep theirs
+        key = (name, shape)
+        buf = scratch.get(key) if scratch is not None else None
+        if buf is None or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            if scratch is not None:
+                scratch[key] = buf
+        return buf
+
+    @staticmethod
+    def _pack_bits(*masks: 'np.ndarray') -> bytearray:
+        """
+        Pack boolean pixel masks into consecutive bit planes, MSB first
+
+        Each row is padded with 0 bits to a whole number of bytes. The
+        planes are written straight into one preallocated buffer instead
+        of being converted to bytes and concatenated.
+        """
+        import numpy as np
+
+        height, width = masks[0].shape
+        row_bytes = (width + 7) // 8
+        out = bytearray(len(masks) * height * row_bytes)
+        planes = np.frombuffer(out, dtype=np.uint8).reshape(len(masks), height, row_bytes)
+        for plane, mask in zip(planes, masks):
+            # packbits is SIMD-vectorized in NumPy: faster than both a
+            # weighted sum over (H, W/8, 8) and uint64 multiply tricks
+            plane[...] = np.packbits(mask, axis=1)
+        return out
+
+    def convert_to_grayscale(self, image: 'Image.Image', dither: Union[bool, str] = False) -> bytes:
         """
         Convert PIL image to 4-level grayscale binary format
 
         Args:
             image: PIL Image (RGB mode)
+            dither: True to Floyd-Steinberg dither to the 4 levels
+                    instead of hard thresholding, 'bayer' for ordered dither
 
         Returns:
             Binary data with 2 bits per pixel (4 pixels per byte)
             Levels: 0b00=white, 0b01=light gray, 0b10=dark gray, 0b11=black
         """
-        # Convert to grayscale
-        gray = image.convert('L')
-        width, height = gray.size
-        pixels = gray.load()
-
-        buffer = []
-        for y in range(height):
-            for x in range(0, width, 4):  # 4 pixels per byte
-                byte = 0
-                for i in range(4):
-                    if x + i < width:
-                        brightness = pixels[x + i, y]
-                        # Map to 4 levels (2 bits)
-                        if brightness > 192:
-                            level = 0b00  # White
-                        elif brightness > 128:
-                            level = 0b01  # Light gray
-                        elif brightness > 64:
-                            level = 0b10  # Dark gray
-                        else:
-                            level = 0b11  # Black
-                        byte |= (level << (6 - i * 2))
-                buffer.append(byte)
-
-        return bytes(buffer)
+        import numpy as np
+        from PIL import Image
+
+        if dither == 'bayer':
+            # Offset each pixel by its Bayer cell before rounding down to
+            # one of the 4 evenly spaced levels (255, 170, 85, 0)
+            luma = np.asarray(image.convert('L'), dtype=np.float32)
+            offset = (_bayer_index(*luma.shape) + np.float32(0.5)) / np.float32(64)
+            bright = np.minimum(np.floor(luma * np.float32(3 / 255) + offset), 3)
+            levels = Image.fromarray((3 - bright).astype(np.uint8))
+        elif dither:
+            # Palette index 0..3 runs white..black, which is the 2-bit level
+            quantized = _as_rgb(image).quantize(palette=_gray_palette(),
+                                               dither=Image.Dither.FLOYDSTEINBERG)
+            levels = quantized
+        else:
+            # Map brightness to 4 levels (2 bits):
+            # >192 white, >128 light gray, >64 dark gray, else black
+            luma = image if image.mode == 'L' else image.convert('L')
+            levels = luma.point(_GRAY_LUT)
+
+        # PIL's 2-bit palette packer puts 4 pixels per byte, first pixel in
+        # the high bits, and pads each row with white (0). putpalette()
+        # relabels an 'L' level image as 'P' in place, without a copy.
+        if levels.mode != 'P':
+            levels.putpalette(_GRAY_RAW_PALETTE)
+        return levels.tobytes('raw', 'P;2')
 
     def send_to_display(self, display_name: str, binary_data: bytes):
         """
@@ -298,8 +730,11 @@ class DisplayServer:
 
         Args:
             display_name: Name of display
-            binary_data: Binary image data
+            binary_data: Binary image data, or a sized iterable of chunks
+                         (see _StreamedBody)
         """
+        import requests
+
         if display_name not in self.displays:
             logger.error(f"Display not found: {display_name}")
             return False
@@ -308,13 +743,23 @@ class DisplayServer:
         history = self.update_history[display_name]
         url = f"http://{display.ip}:{display.port}/update"
 
+        headers = self._POST_HEADERS
+        if display.compress:
+            import gzip
+            raw_size = len(binary_data)
+            if isinstance(binary_data, _StreamedBody):
+                binary_data = b''.join(binary_data)
+            binary_data = gzip.compress(binary_data, self.GZIP_LEVEL, mtime=0)
+            headers = self._GZIP_POST_HEADERS
+            logger.debug(f"[{display.name}] Compressed {raw_size} -> {len(binary_data)} bytes")
+
         try:
             logger.info(f"[{display.name}] Sending {len(binary_data)} bytes to {display.ip}...")
 
-            response = requests.post(
+            response = self._get_session().post(
                 url,
                 data=binary_data,
-                headers={'Content-Type': 'application/octet-stream'},
+                headers=headers,
                 timeout=30
             )
 
@@ -349,28 +794,131 @@ class DisplayServer:
         
         # Generate content
         image = self.generate_content(plugin_name, display_name)
-        if not image:
+        if image is None:
             logger.error(f"[{display_name}] Failed to generate content")
             return False
         
-        # Convert to binary format based on display type
+        # Skip conversion and upload if the display already shows this image
         display = self.displays[display_name]
-        if display.grayscale:
-            binary_data = self.convert_to_grayscale(image)
-        else:
-            binary_data = self.convert_to_binary(image, display.tricolor)
+        image_hash = self._image_hash(image)
+        if self.last_image_hash.get(display_name) == image_hash:
+            logger.info(f"[{display.name}] Content unchanged, skipping update")
+            logger.info(f"{'='*70}\n")
+            return True
         
-        # Save binary for debugging
-        binary_path = self.output_dir / f"{display_name}_{plugin_name}.bin"
-        with open(binary_path, 'wb') as f:
-            f.write(binary_data)
-        logger.info(f"[{display.name}] Saved binary: {binary_path}")
+        # Convert to binary format based on display type, reusing a recent
+        # conversion of the same image (failed send, alternating content)
+        key = (display_name, image_hash)
+        if isinstance(image, (bytes, bytearray)):
+            # Packed by the plugin: nothing to convert, so nothing to cache
+            cached = image
+        else:
+            with self._lock:
+                cached = self._binary_cache.get(key)
+                if cached is not None:
+                    self._binary_cache.move_to_end(key)
+        if cached is not None:
+            body = cached
+        elif display.compress or display.dither not in (False, 'bayer'):
+            # Error diffusion crosses rows, and gzip needs the whole payload,
+            # so convert the whole image first
+            body = display.to_binary(image)
+        else:
+            # Thresholded and Bayer-dithered rows convert independently:
+            # stream row bands so conversion overlaps the upload
+            body = _StreamedBody(self._iter_binary(display, image), display.binary_size)
         
         # Send to display
-        success = self.send_to_display(display_name, binary_data)
+        success = self.send_to_display(display_name, body)
+        if success:
+            self.last_image_hash[display_name] = image_hash
+        
+        if cached is not None:
+            binary_data = cached
+        else:
+            binary_data = body.getvalue() if isinstance(body, _StreamedBody) else body
+            with self._lock:
+                self._binary_cache[key] = binary_data
+                if len(self._binary_cache) > self.BINARY_CACHE_SIZE:
+                    self._binary_cache.popitem(last=False)
+        
+        # Save binary for debugging
+        if self.debug:
+            binary_path = self.output_dir / f"{display_name}_{plugin_name}.bin"
+            self._write_debug_file(binary_path, binary_data)
         
         logger.info(f"{'='*70}\n")
         return success
+
+    def _iter_binary(self, display: Display, image: 'Image.Image') -> Iterator[bytes]:
+        """
+        Convert an image in horizontal bands, yielding display bytes in order
+
+        Only valid for conversions that treat rows independently:
+        thresholding and Bayer dithering. For tricolor displays the black
+        plane is yielded band by band and the red plane bands, converted
+        alongside, follow once the black plane is done.
+        """
+        width, height = image.size
+        rows = max(1, self.STREAM_CHUNK_BYTES * height // display.binary_size)
+        if display.dither == 'bayer':
+            # Start every band on a Bayer tile boundary so the pattern lines up
+            rows = -(-rows // 8) * 8
+        red_bands = []
+        for top in range(0, height, rows):
+            band = memoryview(display.to_binary(image.crop((0, top, width, min(top + rows, height)))))
+            if display.tricolor:
+                half = len(band) // 2
+                red_bands.append(band[half:])
+                band = band[:half]
+            yield band
+        yield from red_bands
+
+    def _write_debug_file(self, path: Path, data):
+        """
+        Queue a debug image or binary to be written by the writer thread
+
+        Args:
+            path: Destination file
+            data: PIL Image (saved by extension) or bytes-like binary data
+        """
+        with self._lock:
+            if self._debug_queue is None:
+                self._debug_queue = queue.Queue()
+                threading.Thread(target=self._debug_writer, name="debug-writer",
+                                 daemon=True).start()
+        self._debug_queue.put((path, data))
+
+    def _debug_writer(self):
+        """Drain the debug queue, writing each file to disk"""
+        while True:
+            path, data = self._debug_queue.get()
+            # Write beside the target and rename over it, so anything
+            # watching output/ never reads a half-written file. The temp
+            # name keeps the extension PIL picks the format from.
+            tmp_path = path.with_name(f".{path.stem}.tmp{path.suffix}")
+            try:
+                if isinstance(data, (bytes, bytearray)):
+                    tmp_path.write_bytes(data)
+                else:
+                    data.save(tmp_path)
+                os.replace(tmp_path, path)
+                logger.debug(f"Saved debug file: {path}")
+            except Exception as e:
+                logger.error(f"Failed to save debug file {path}: {e}")
+            finally:
+                self._debug_queue.task_done()
+
+    @staticmethod
+    def _image_hash(image: Union['Image.Image', bytes]) -> str:
+        """Content hash of an image's mode, size and pixels, or of packed bytes"""
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(image, (bytes, bytearray)):
+            digest.update(image)
+        else:
+            digest.update(f"{image.mode} {image.size}".encode())
+            digest.update(image.tobytes())
+        return digest.hexdigest()
     
     def schedule_update(self, display_name: str, plugin_name: str, interval: str):
         """
@@ -381,26 +929,46 @@ class DisplayServer:
             plugin_name: Plugin to use
             interval: Schedule string (e.g., "10 minutes", "daily at 06:00")
         """
+        import schedule
+
         def update_job():
-            self.update_display(display_name, plugin_name)
+            # Hand off to the worker pool so jobs due together run in parallel
+            self._get_executor().submit(self._run_update, display_name, plugin_name)
+        
+        parsed = _parse_interval(interval)
+        if parsed is None:
+            logger.error(f"Unknown schedule format: {interval}")
+            return
         
-        if "minutes" in interval:
-            minutes = int(interval.split()[0])
-            schedule.every(minutes).minutes.do(update_job)
-            logger.info(f"Scheduled {display_name} <- {plugin_name} every {minutes} minutes")
+        kind, value = parsed
+        if kind == 'minutes':
+            schedule.every(value).minutes.do(update_job)
+            logger.info(f"Scheduled {display_name} <- {plugin_name} every {value} minutes")
             
-        elif "hours" in interval:
-            hours = int(interval.split()[0])
-            schedule.every(hours).hours.do(update_job)
-            logger.info(f"Scheduled {display_name} <- {plugin_name} every {hours} hours")
+        elif kind == 'hours':
+            schedule.every(value).hours.do(update_job)
+            logger.info(f"Scheduled {display_name} <- {plugin_name} every {value} hours")
             
-        elif "daily at" in interval:
-            time_str = interval.split("at")[1].strip()
-            schedule.every().day.at(time_str).do(update_job)
-            logger.info(f"Scheduled {display_name} <- {plugin_name} daily at {time_str}")
-        
-        else:
-            logger.error(f"Unknown schedule format: {interval}")
+        elif kind == 'daily':
+            schedule.every().day.at(value).do(update_job)
+            logger.info(f"Scheduled {display_name} <- {plugin_name} daily at {value}")
+
+        self._schedule_changed.set()
+
+    def _run_update(self, display_name: str, plugin_name: str):
+        """Worker-thread body of a scheduled update"""
+        display = self.displays.get(display_name)
+        if display is None:
+            logger.error(f"Display not found: {display_name}")
+            return False
+        try:
+            with display.lock:
+                return self.update_display(display_name, plugin_name)
+        except Exception as e:
+            # Nobody waits on the future, so log here or the error is lost
+            logger.error(f"[{display_name}] Update with {plugin_name} failed: {e}",
+                         exc_info=True)
+            return False
 
     def get_update_history(self, display_name: str = None) -> Dict:
         """
@@ -432,6 +1000,8 @@ class DisplayServer:
         if display_name not in self.displays:
             return {'error': 'Display not found'}
 
+        import requests
+
         display = self.displays[display_name]
         url = f"http://{display.ip}:{display.port}/"
 
@@ -440,7 +1010,7 @@ class DisplayServer:
             'ip': display.ip,
             'port': display.port,
             'configured_resolution': f"{display.width}x{display.height}",
-            'configured_mode': 'GRAY' if display.grayscale else ('BWR' if display.tricolor else 'BW'),
+            'configured_mode': display.mode,
             'online': False,
             'reported_resolution': None,
             'reported_mode': None,
@@ -451,7 +1021,7 @@ class DisplayServer:
         try:
             import time
             start = time.time()
-            response = requests.get(url, timeout=timeout)
+            response = self._get_session().get(url, timeout=timeout)
             latency = (time.time() - start) * 1000
 
             if response.status_code == 200:
@@ -487,17 +1057,31 @@ class DisplayServer:
         Returns:
             Dictionary mapping display names to their status
         """
-        return {name: self.query_display_status(name, timeout)
-                for name in self.displays}
+        if not self.displays:
+            return {}
+
+        # Queries are I/O-bound, so overlap them: total time is the slowest
+        # display rather than the sum. Create the shared session up front so
+        # worker threads don't race to build it.
+        self._get_session()
+        names = list(self.displays)
+        with ThreadPoolExecutor(max_workers=min(16, len(names))) as executor:
+            statuses = executor.map(lambda name: self.query_display_status(name, timeout), names)
+            return dict(zip(names, statuses))
 
     def run(self):
         """Run the display server (blocking)"""
+        import schedule
+
         logger.info("\n" + "="*70)
         logger.info("Display Server Running")
         logger.info(f"Displays: {len(self.displays)}")
         logger.info(f"Plugins: {len(self.plugins)}")
         logger.info("="*70 + "\n")
         
+        # Create the shared session before update threads start using it
+        self._get_session()
+
         # Run initial updates
         logger.info("Running initial updates...")
         schedule.run_all()
@@ -505,14 +1089,25 @@ class DisplayServer:
         # Main loop
         try:
             while True:
+                # Sleep until the next job is due, or until schedule_update()
+                # adds one that may be due sooner
+                self._schedule_changed.clear()
+                idle = schedule.idle_seconds()
+                if idle is None or idle > 0:
+                    self._schedule_changed.wait(min(idle or self.MAX_IDLE_SECONDS,
+                                                    self.MAX_IDLE_SECONDS))
                 schedule.run_pending()
-                time.sleep(1)
         except KeyboardInterrupt:
             logger.info("\n\nShutting down...")
             self.cleanup()
     
     def cleanup(self):
         """Cleanup resources"""
+        # Let running updates finish before their plugins and session go away
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        
         logger.info("Cleaning up plugins...")
         for name, plugin in self.plugins.items():
             try:
@@ -520,6 +1115,14 @@ class DisplayServer:
             except Exception as e:
                 logger.error(f"Error cleaning up {name}: {e}")
         
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        
+        # Let pending debug files finish writing
+        if self._debug_queue is not None:
+            self._debug_queue.join()
+        
         logger.info("Shutdown complete")
 
 
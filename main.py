@@ -31,7 +31,9 @@ def main():
         sys.exit(1)
     
     # Create server
-    server = DisplayServer(output_dir=config.server_config.get('output_dir'))
+    server = DisplayServer(output_dir=config.server_config.get('output_dir'),
+                           debug=config.server_config.get('debug', False),
+                           resample=config.server_config.get('resample', 'bilinear'))
     
     # Register displays
     logger.info("\nRegistering displays...")
@@ -42,7 +44,10 @@ def main():
             display_config['port'],
             display_config['width'],
             display_config['height'],
-            display_config.get('tricolor', False)
+            tricolor=display_config.get('tricolor', False),
+            grayscale=display_config.get('grayscale', False),
+            dither=display_config.get('dither', False),
+            compress=display_config.get('compress', False)
         )
     
     # Load plugins
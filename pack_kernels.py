@@ -0,0 +1,60 @@
+"""
+Numba-compiled packing kernels for display_server
+
+Optional: importing this module requires numba. display_server imports it
+lazily and falls back to its NumPy conversion when numba isn't installed.
+
+Each kernel thresholds an RGB uint8 array of shape (H, W, 3) and packs the
+result MSB first into a flat uint8 output, one padded row of bytes per
+image row (1 = pixel set). Rows are independent, so they are split across
+cores with prange; compiled code is cached on disk so only the first run
+pays for compilation.
+"""
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def pack_bw(arr, out):
+    """Black (<60 on all channels) plane"""
+    height, width = arr.shape[0], arr.shape[1]
+    row_bytes = (width + 7) // 8
+    for y in prange(height):
+        for xb in range(row_bytes):
+            byte = 0
+            for bit in range(8):
+                x = xb * 8 + bit
+                byte <<= 1
+                if x < width:
+                    byte |= (arr[y, x, 0] < 60) & (arr[y, x, 1] < 60) & (arr[y, x, 2] < 60)
+            out[y * row_bytes + xb] = byte
+
+
+@njit(parallel=True, cache=True)
+def pack_bwr(arr, out):
+    """
+    Black plane followed by red plane, classified in one pass
+
+    Red is r > 150 and r > 1.5*g and r > 1.5*b (as 2r > 3g in integers);
+    black takes precedence over red.
+    """
+    height, width = arr.shape[0], arr.shape[1]
+    row_bytes = (width + 7) // 8
+    plane = height * row_bytes
+    for y in prange(height):
+        for xb in range(row_bytes):
+            black = 0
+            red = 0
+            for bit in range(8):
+                x = xb * 8 + bit
+                black <<= 1
+                red <<= 1
+                if x < width:
+                    r = int(arr[y, x, 0])
+                    g = int(arr[y, x, 1])
+                    b = int(arr[y, x, 2])
+                    is_black = (r < 60) & (g < 60) & (b < 60)
+                    black |= is_black
+                    red |= (r > 150) & (2 * r > 3 * g) & (2 * r > 3 * b) & (not is_black)
+            out[y * row_bytes + xb] = black
+            out[plane + y * row_bytes + xb] = red
@@ -3,6 +3,8 @@ Plugins Package
 Contains all content generation plugins for e-ink displays
 """
 
-from .base import ContentPlugin, PluginError, PluginRegistry
+from .base import (ContentPlugin, PackedPlugin, BackgroundRenderPlugin, PluginError,
+                   PluginRegistry)
 
-__all__ = ['ContentPlugin', 'PluginError', 'PluginRegistry']
+__all__ = ['ContentPlugin', 'PackedPlugin', 'BackgroundRenderPlugin', 'PluginError',
+           'PluginRegistry']
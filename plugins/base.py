@@ -5,12 +5,24 @@ Provides abstract base class for all content plugins
 
 from abc import ABC, abstractmethod
 from PIL import Image
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
+import threading
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+def format_time(dt: datetime) -> str:
+    """HH:MM AM/PM, formatted directly rather than via strftime"""
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+def format_datetime(dt: datetime) -> str:
+    """MM/DD/YYYY HH:MM AM/PM, formatted directly rather than via strftime"""
+    return f"{dt.month:02d}/{dt.day:02d}/{dt.year:04d} {format_time(dt)}"
+
+
 class ContentPlugin(ABC):
     """
     Abstract base class for content plugins
@@ -28,6 +40,7 @@ class ContentPlugin(ABC):
         """
         self.config = config or {}
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._local = threading.local()
 
     def get_name(self) -> str:
         """
@@ -63,7 +76,8 @@ class ContentPlugin(ABC):
                        (white, light gray, dark gray, black)
 
         Returns:
-            PIL Image in RGB mode (will be converted to display format by server)
+            PIL Image in RGB mode (will be converted to display format by server).
+            For B&W content an 'L' or '1' image also works and converts faster.
 
         Notes:
             - For B&W displays: use black (0,0,0) and white (255,255,255)
@@ -76,6 +90,34 @@ class ContentPlugin(ABC):
         """
         pass
     
+    def blank_canvas(self, width: int, height: int, mode: str = 'RGB') -> Image.Image:
+        """
+        Get a white canvas, reused across calls instead of reallocated
+
+        Each worker thread keeps one canvas per size, and the server is done
+        with a returned image before that thread generates again, so the
+        canvas can be handed back from generate(). Don't hold on to it
+        across calls.
+
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            mode: PIL mode; 'L' is enough for content without red and
+                  converts faster than 'RGB'
+
+        Returns:
+            PIL Image in the given mode, filled white
+        """
+        canvases = getattr(self._local, 'canvases', None)
+        if canvases is None:
+            canvases = self._local.canvases = {}
+        canvas = canvases.get((mode, width, height))
+        if canvas is None:
+            canvas = canvases[(mode, width, height)] = Image.new(mode, (width, height), 'white')
+        else:
+            canvas.paste('white', (0, 0, width, height))
+        return canvas
+    
     def should_update(self) -> bool:
         """
         Check if content needs updating
@@ -113,6 +155,103 @@ class ContentPlugin(ABC):
         }
 
 
+class PackedPlugin(ContentPlugin):
+    """
+    Content plugin that can draw straight into the display's wire format
+
+    The server calls generate_packed() first and sends its bytes as they
+    are, skipping the PIL image and its conversion. Returning None falls
+    back to generate(), which is still required.
+    """
+
+    def generate_packed(self, width: int, height: int, tricolor: bool = False,
+                        grayscale: bool = False) -> Optional[bytes]:
+        """
+        Generate content already packed for the display
+
+        Args:
+            width: Display width in pixels
+            height: Display height in pixels
+            tricolor: Whether display supports red color (B/W/R)
+            grayscale: Whether display supports 4-level grayscale
+
+        Returns:
+            Display bytes, or None to use generate() instead:
+            - B&W: one plane, 1 bit per pixel, MSB first, 1 = black, each
+              row padded to a whole byte
+            - Tricolor: black plane followed by a red plane (1 = red)
+            - Grayscale: 2 bits per pixel, 0b00 white to 0b11 black, first
+              pixel in the high bits, rows padded to a whole byte
+        """
+        return None
+
+
+class BackgroundRenderPlugin(ContentPlugin):
+    """
+    Content plugin whose slow renders run off the update path
+
+    The first generate() for a display size and mode renders synchronously.
+    After that, generate() returns the last image at once and starts a
+    render in a background thread, whose result is served on the next call
+    (stale-while-revalidate), so the display is at most one update behind.
+    Subclasses implement render() instead of generate(). Set
+    'background_refresh': False in the plugin config to always render
+    synchronously.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        # Last render per (width, height, tricolor, grayscale)
+        self._rendered: Dict[Tuple[int, int, bool, bool], Image.Image] = {}
+        # Renders never overlap, so render() needn't be thread-safe
+        self._render_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @abstractmethod
+    def render(self, width: int, height: int, tricolor: bool = False,
+               grayscale: bool = False) -> Image.Image:
+        """
+        Render fresh content; same arguments and result as generate()
+        """
+        pass
+
+    def generate(self, width: int, height: int, tricolor: bool = False,
+                 grayscale: bool = False) -> Image.Image:
+        key = (width, height, tricolor, grayscale)
+        image = self._rendered.get(key)
+        if image is None or not self.config.get('background_refresh', True):
+            return self._render(key)
+
+        thread = self._refresh_thread
+        if thread is None or not thread.is_alive():
+            self._refresh_thread = threading.Thread(target=self._refresh, args=(key,),
+                                                    name=f"{self.get_name()}-refresh",
+                                                    daemon=True)
+            self._refresh_thread.start()
+        return image
+
+    def _render(self, key: Tuple[int, int, bool, bool]) -> Image.Image:
+        """Render and keep the result, copied off any reused canvas"""
+        with self._render_lock:
+            image = self.render(*key).copy()
+        self._rendered[key] = image
+        return image
+
+    def _refresh(self, key: Tuple[int, int, bool, bool]):
+        """Background render; on failure the previous image keeps being served"""
+        try:
+            self._render(key)
+        except Exception as e:
+            self.logger.error(f"Background refresh failed: {e}")
+
+    def cleanup(self):
+        """Wait for an in-flight background render and drop cached images"""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join()
+        self._rendered.clear()
+
+
 class PluginError(Exception):
     """Exception raised when plugin fails to generate content"""
     pass
@@ -127,6 +266,9 @@ class PluginRegistry:
     
     def __init__(self):
         self.plugins: Dict[str, ContentPlugin] = {}
+        # (name, plugin) pairs, rebuilt on register/unregister so listing
+        # and cleanup iterate a stable tuple rather than the live dict
+        self._snapshot: Tuple[Tuple[str, ContentPlugin], ...] = ()
         self.logger = logging.getLogger('PluginRegistry')
     
     def register(self, name: str, plugin: ContentPlugin):
@@ -141,6 +283,7 @@ class PluginRegistry:
             self.logger.warning(f"Plugin '{name}' already registered, replacing...")
         
         self.plugins[name] = plugin
+        self._snapshot = tuple(self.plugins.items())
         self.logger.info(f"Registered plugin: {name} ({plugin.__class__.__name__})")
     
     def unregister(self, name: str):
@@ -153,6 +296,7 @@ class PluginRegistry:
         if name in self.plugins:
             self.plugins[name].cleanup()
             del self.plugins[name]
+            self._snapshot = tuple(self.plugins.items())
             self.logger.info(f"Unregistered plugin: {name}")
     
     def get(self, name: str) -> Optional[ContentPlugin]:
@@ -176,12 +320,12 @@ class PluginRegistry:
         """
         return {
             name: plugin.get_info() 
-            for name, plugin in self.plugins.items()
+            for name, plugin in self._snapshot
         }
     
     def cleanup_all(self):
         """Cleanup all registered plugins"""
-        for name, plugin in self.plugins.items():
+        for name, plugin in self._snapshot:
             try:
                 plugin.cleanup()
             except Exception as e:
@@ -30,6 +30,16 @@ class CalendarPlugin(ContentPlugin):
         self.days_ahead = config.get('days_ahead', 7)
         self.max_events = config.get('max_events', 10)
 
+        # Fonts are loaded once and reused by every generate()
+        try:
+            self.title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
+            self.date_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
+            self.event_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
+        except Exception:
+            self.title_font = ImageFont.load_default()
+            self.date_font = ImageFont.load_default()
+            self.event_font = ImageFont.load_default()
+
         # TODO: Add Google Calendar API authentication
         # For now, this is a mock implementation
 
@@ -57,22 +67,12 @@ class CalendarPlugin(ContentPlugin):
     def generate(self, width, height, tricolor=False, grayscale=False):
         """Generate calendar display"""
         # Create white background
-        image = Image.new('RGB', (width, height), 'white')
+        image = self.blank_canvas(width, height)
         draw = ImageDraw.Draw(image)
         
-        # Try to load fonts
-        try:
-            title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-            date_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-            event_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
-        except Exception:
-            title_font = ImageFont.load_default()
-            date_font = ImageFont.load_default()
-            event_font = ImageFont.load_default()
-        
         # Draw title
         title = f"Calendar - Next {self.days_ahead} Days"
-        draw.text((20, 20), title, fill='black', font=title_font)
+        draw.text((20, 20), title, fill='black', font=self.title_font)
         
         # Draw line under title
         draw.line([(20, 70), (width - 20, 70)], fill='black', width=2)
@@ -81,15 +81,18 @@ class CalendarPlugin(ContentPlugin):
         events = self.fetch_events()
         
         # Draw events
+        now = datetime.now()
+        today = now.date()
         y = 90
         last_date = None
         
         for event in events:
-            event_date = event['date'].strftime('%A, %B %d')
+            event_date = event['date'].date()
             
-            # Draw date header if new day
+            # Draw date header if new day (formatted once per day, not per event)
             if event_date != last_date:
-                draw.text((20, y), event_date, fill='black', font=date_font)
+                header = event['date'].strftime('%A, %B %d')
+                draw.text((20, y), header, fill='black', font=self.date_font)
                 y += 35
                 last_date = event_date
             
@@ -98,10 +101,10 @@ class CalendarPlugin(ContentPlugin):
             title_str = event['title']
             
             # Use red for today's events if tricolor
-            color = 'red' if tricolor and event['date'].date() == datetime.now().date() else 'black'
+            color = 'red' if tricolor and event_date == today else 'black'
             
-            draw.text((40, y), f"{time_str}", fill=color, font=event_font)
-            draw.text((120, y), f"{title_str}", fill=color, font=event_font)
+            draw.text((40, y), f"{time_str}", fill=color, font=self.event_font)
+            draw.text((120, y), f"{title_str}", fill=color, font=self.event_font)
             
             y += 30
             
@@ -110,8 +113,8 @@ class CalendarPlugin(ContentPlugin):
                 break
         
         # Draw footer
-        footer_text = f"Updated: {datetime.now().strftime('%I:%M %p')}"
-        draw.text((20, height - 30), footer_text, fill='black', font=event_font)
+        footer_text = f"Updated: {now.strftime('%I:%M %p')}"
+        draw.text((20, height - 30), footer_text, fill='black', font=self.event_font)
         
         return image
 
@@ -3,6 +3,8 @@ Newspaper Plugin
 Downloads and displays newspaper front page
 """
 
+import os
+from email.utils import formatdate
 from pathlib import Path
 from PIL import Image
 from datetime import datetime
@@ -32,7 +34,7 @@ class NewspaperPlugin(ContentPlugin):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.last_download_date = None
-        self.cached_image = None
+        self.cached_path = None
 
     def get_description(self) -> str:
         return "Indianapolis Star newspaper front page"
@@ -40,33 +42,48 @@ class NewspaperPlugin(ContentPlugin):
     def should_update(self):
         """Only update once per day"""
         today = datetime.now().date()
-        if self.last_download_date == today and self.cached_image:
+        if self.last_download_date == today and self.cached_path:
             return False
         return True
     
     def download_newspaper(self):
-        """Download today's newspaper"""
+        """Download today's newspaper, returning the path of the cached JPEG"""
         date_str = datetime.now().strftime('%Y-%m-%d')
         url = self.url_template.format(date=date_str)
         
+        cache_path = self.cache_dir / f"newspaper_{date_str}.jpg"
+        
         try:
+            # Revalidate today's copy if one is already on disk (e.g. after
+            # a restart) so the server can answer 304 instead of resending it
+            headers = {}
+            if cache_path.exists():
+                headers['If-Modified-Since'] = formatdate(cache_path.stat().st_mtime, usegmt=True)
+            
             self.logger.info(f"Downloading newspaper: {url}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            with requests.get(url, timeout=30, headers=headers, stream=True) as response:
+                if response.status_code == 304:
+                    self.logger.info("Newspaper not modified, using cached copy")
+                else:
+                    response.raise_for_status()
 
-            # Save to cache
-            cache_path = self.cache_dir / f"newspaper_{date_str}.jpg"
-            with open(cache_path, 'wb') as f:
-                f.write(response.content)
+                    # Stream to cache in chunks rather than holding the whole
+                    # JPEG in memory; written aside and renamed so a partial
+                    # download never looks like a valid cached copy
+                    tmp_path = cache_path.with_name(f".{cache_path.name}.tmp")
+                    size = 0
+                    with open(tmp_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=64 * 1024):
+                            f.write(chunk)
+                            size += len(chunk)
+                    os.replace(tmp_path, cache_path)
 
-            self.logger.info(f"Downloaded {len(response.content)} bytes")
+                    self.logger.info(f"Downloaded {size} bytes")
             
-            # Load as image
-            image = Image.open(cache_path)
             self.last_download_date = datetime.now().date()
-            self.cached_image = image
+            self.cached_path = cache_path
             
-            return image
+            return cache_path
             
         except Exception as e:
             raise PluginError(f"Failed to download newspaper: {e}")
@@ -76,24 +93,24 @@ class NewspaperPlugin(ContentPlugin):
         Process newspaper for display
         
         Steps:
-        1. Resize to target_height pixels wide (for rotation)
-        2. Crop to target_width pixels tall
-        3. Rotate 90° clockwise (portrait → landscape)
-        4. Result is target_width x target_height landscape
+        1. Resize to target_height pixels wide (for rotation), keeping only
+           the top target_width rows - crop and resize in one pass
+        2. Rotate 90° clockwise (portrait → landscape)
+        3. Result is target_width x target_height landscape
         """
-        # Step 1: Resize width to match display height (will become width after rotation)
+        # Step 1: Resize width to match display height (will become width after
+        # rotation), cropped to target width (will become height). The source
+        # box makes resize() read only the rows that survive the crop.
         aspect_ratio = image.height / image.width
         new_height = int(target_height * aspect_ratio)
-        image_resized = image.resize((target_height, new_height), Image.LANCZOS)
-        self.logger.debug(f"Resized to: {image_resized.size}")
-
-        # Step 2: Crop to target width (will become height after rotation)
-        crop_height = min(target_width, image_resized.height)
-        image_cropped = image_resized.crop((0, 0, target_height, crop_height))
-        self.logger.debug(f"Cropped to: {image_cropped.size}")
+        crop_height = min(target_width, new_height)
+        source_box = (0, 0, image.width, crop_height * image.height / new_height)
+        image_resized = image.resize((target_height, crop_height), Image.LANCZOS,
+                                     box=source_box)
+        self.logger.debug(f"Resized and cropped to: {image_resized.size}")
 
-        # Step 3: Rotate 90° clockwise
-        image_rotated = image_cropped.rotate(-90, expand=True)
+        # Step 2: Rotate 90° clockwise (a transpose: exact, no resampling)
+        image_rotated = image_resized.transpose(Image.Transpose.ROTATE_270)
         self.logger.debug(f"Rotated to: {image_rotated.size}")
         
         # Convert to RGB
@@ -105,17 +122,21 @@ class NewspaperPlugin(ContentPlugin):
     def generate(self, width, height, tricolor=False, grayscale=False):
         """Generate newspaper display"""
         # Download if needed
-        if not self.cached_image or self.should_update():
-            image = self.download_newspaper()
+        if not self.cached_path or self.should_update():
+            path = self.download_newspaper()
         else:
             self.logger.info("Using cached newspaper")
-            image = self.cached_image
+            path = self.cached_path
         
-        # Process for display
-        processed = self.process_newspaper(image, width, height)
+        # Process for display. The page is reopened per render and decoded
+        # at the smallest JPEG scale that still leaves 2x the resize target,
+        # so no full-resolution copy stays in memory between updates.
+        with Image.open(path) as image:
+            image.draft('RGB', (height * 2, height * 2 * image.height // image.width))
+            processed = self.process_newspaper(image, width, height)
         
         return processed
     
     def cleanup(self):
-        """Cleanup cached images"""
-        self.cached_image = None
+        """Forget the cached page"""
+        self.cached_path = None
@@ -3,6 +3,7 @@ Photo Frame Plugin
 Displays photos from a directory with optional rotation
 """
 
+import os
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
@@ -25,6 +26,8 @@ class PhotoFramePlugin(ContentPlugin):
         - fit_mode: 'contain' or 'cover' (default: contain)
     """
     
+    PHOTO_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif'})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
 
@@ -38,16 +41,23 @@ class PhotoFramePlugin(ContentPlugin):
         self.show_caption = config.get('show_caption', True)
         self.fit_mode = config.get('fit_mode', 'contain')
 
-        # Get list of image files
-        self.photos = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.gif']:
-            self.photos.extend(self.photo_dir.glob(ext))
-            self.photos.extend(self.photo_dir.glob(ext.upper()))
+        # Caption font is loaded once and reused by every generate()
+        try:
+            self.caption_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
+        except Exception:
+            self.caption_font = ImageFont.load_default()
+
+        # Get list of image files in one directory pass (suffix match is
+        # case-insensitive)
+        with os.scandir(self.photo_dir) as entries:
+            self.photos = sorted(
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in self.PHOTO_EXTENSIONS
+                and entry.is_file()
+            )
 
         if not self.photos:
             raise PluginError(f"No photos found in {self.photo_dir}")
-
-        self.photos.sort()
         self.current_index = 0
 
         self.logger.info(f"Loaded {len(self.photos)} photos from {self.photo_dir}")
@@ -90,7 +100,7 @@ class PhotoFramePlugin(ContentPlugin):
             resized = image.resize((new_width, new_height), Image.LANCZOS)
             
             # Create white background and paste centered
-            canvas = Image.new('RGB', (width, height), 'white')
+            canvas = self.blank_canvas(width, height)
             x = (width - new_width) // 2
             y = (height - new_height) // 2
             canvas.paste(resized, (x, y))
@@ -103,19 +113,17 @@ class PhotoFramePlugin(ContentPlugin):
         photo_path = self.get_next_photo()
         self.logger.info(f"Displaying: {photo_path.name}")
         
-        # Load and fit image
-        photo = Image.open(photo_path)
-        photo = photo.convert('RGB')
-        photo = self.fit_image(photo, width, height)
+        # Load and fit image. JPEGs are decoded at the smallest DCT scale
+        # that still leaves 2x the display size, and the file is closed
+        # as soon as the fitted copy exists.
+        with Image.open(photo_path) as photo:
+            photo.draft('RGB', (width * 2, height * 2))
+            photo = self.fit_image(photo.convert('RGB'), width, height)
         
         # Add caption if enabled
         if self.show_caption:
             draw = ImageDraw.Draw(photo)
-            
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
-            except Exception:
-                font = ImageFont.load_default()
+            font = self.caption_font
             
             # Draw caption background
             caption = photo_path.stem
@@ -3,14 +3,51 @@ Screen Status Plugin for E-ink Display System
 Displays status of all configured screens on the network
 """
 
-from .base import ContentPlugin
+import functools
+from .base import BackgroundRenderPlugin, PackedPlugin, format_datetime
 from PIL import Image, ImageDraw, ImageFont
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 
-class ScreenStatusPlugin(ContentPlugin):
+# Font files present on this machine, in order of preference; checked once
+# at import rather than on every font load
+_FONT_PATHS = [
+    path for path in (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/Monaco.ttf",
+    )
+    if Path(path).exists()
+]
+
+# 'L' to '1' table marking the pixels the server would make black (below 60)
+# as set bits, which is the firmware's 1 = black wire format
+_BLACK_LUT = [255 if v < 60 else 0 for v in range(256)]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_timestamp(dt: Optional[datetime]) -> str:
+    """
+    Format a datetime for display
+
+    Cached: the same last-success/last-error timestamps come back on every
+    render until a display updates again.
+    """
+    if dt is None:
+        return "Never"
+    if isinstance(dt, str):
+        # Parse ISO format string
+        try:
+            dt = datetime.fromisoformat(dt)
+        except ValueError:
+            return dt
+    return format_datetime(dt)
+
+
+class ScreenStatusPlugin(BackgroundRenderPlugin, PackedPlugin):
     """
     Plugin that displays the status of all configured e-ink displays
 
@@ -26,6 +63,8 @@ class ScreenStatusPlugin(ContentPlugin):
         timeout: Seconds to wait when pinging displays (default: 3)
         title: Title shown at top (default: "Display Status")
         show_ip: Whether to show IP addresses (default: True)
+        background_refresh: Serve the previous render while probing the
+            displays for the next one (default: True)
 
     Example:
         plugins = {
@@ -49,37 +88,44 @@ class ScreenStatusPlugin(ContentPlugin):
         self.timeout = config.get('timeout', 3) if config else 3
         self.title = config.get('title', 'Display Status') if config else 'Display Status'
         self.show_ip = config.get('show_ip', True) if config else True
+        # Loaded fonts by point size, so redraws don't re-parse the font file
+        self._fonts: Dict[int, Any] = {}
+        # Rasterized status dots by (point size, glyph), pasted per row
+        self._indicators: Dict[tuple, Image.Image] = {}
+        # Last frame, drawn without its timestamp, and the key of the size,
+        # mode, title and status fields it was drawn from
+        self._frame_key: Optional[tuple] = None
+        self._last_image: Optional[Image.Image] = None
 
     def get_description(self) -> str:
         return "Status dashboard showing all display states"
 
     def _load_font(self, size: int):
-        """Load a font, falling back to default if needed"""
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/Monaco.ttf",
-        ]
-        for path in font_paths:
-            if Path(path).exists():
-                try:
-                    return ImageFont.truetype(path, size)
-                except Exception:
-                    continue
-        return ImageFont.load_default()
-
-    def _format_timestamp(self, dt: Optional[datetime]) -> str:
-        """Format a datetime for display"""
-        if dt is None:
-            return "Never"
-        if isinstance(dt, str):
-            # Parse ISO format string
+        """Load a font, falling back to default if needed (cached per size)"""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = self._open_font(size)
+        return font
+
+    def _indicator_mask(self, size: int, indicator: str) -> Image.Image:
+        """Coverage mask of a status dot, rasterized once per size"""
+        mask = self._indicators.get((size, indicator))
+        if mask is None:
+            font = self._load_font(size)
+            _, _, right, bottom = font.getbbox(indicator)
+            mask = Image.new('L', (max(right, 1), max(bottom, 1)), 0)
+            ImageDraw.Draw(mask).text((0, 0), indicator, fill=255, font=font)
+            self._indicators[(size, indicator)] = mask
+        return mask
+
+    def _open_font(self, size: int):
+        """Open the first available TrueType font at the given size"""
+        for path in _FONT_PATHS:
             try:
-                dt = datetime.fromisoformat(dt)
-            except ValueError:
-                return dt
-        return dt.strftime("%m/%d/%Y %I:%M %p")
+                return ImageFont.truetype(path, size)
+            except Exception:
+                continue
+        return ImageFont.load_default()
 
     def _get_status_data(self) -> list:
         """Gather status data for all displays"""
@@ -117,21 +163,61 @@ class ScreenStatusPlugin(ContentPlugin):
         displays.sort(key=lambda x: x['name'])
         return displays
 
-    def generate(self, width: int, height: int, tricolor: bool = False,
-                 grayscale: bool = False) -> Image.Image:
+    def generate_packed(self, width: int, height: int, tricolor: bool = False,
+                        grayscale: bool = False) -> Optional[bytes]:
+        """Pack B&W frames here; tricolor and grayscale go through generate()"""
+        if tricolor or grayscale:
+            return None
+        return self.generate(width, height).point(_BLACK_LUT, '1').tobytes()
+
+    def render(self, width: int, height: int, tricolor: bool = False,
+               grayscale: bool = False) -> Image.Image:
         """Generate status display image"""
+        displays = self._get_status_data()
 
-        # Create white background
-        image = Image.new('RGB', (width, height), 'white')
+        # Reuse the last frame if nothing drawn on it has changed (latency and
+        # counters vary per probe but aren't drawn); only the timestamp is
+        # redrawn on top
+        frame_key = (width, height, tricolor, grayscale, self.title,
+                     tuple((d['name'], d['resolution'], d['mode'], d['ip'], d['online'],
+                            d['last_success'], d['last_error']) for d in displays))
+        if frame_key == self._frame_key:
+            image = self._last_image.copy()
+        else:
+            image = self._draw(width, height, tricolor, grayscale, displays)
+            self._frame_key = frame_key
+            self._last_image = image.copy()
+
+        self._draw_timestamp(image, width, format_datetime(datetime.now()))
+        return image
+
+    @staticmethod
+    def _font_sizes(width: int) -> tuple:
+        """Title, name and detail point sizes for a display width"""
+        if width >= 600:
+            return 28, 20, 16
+        if width >= 400:
+            return 22, 16, 12
+        return 18, 14, 10
+
+    def _draw_timestamp(self, image: Image.Image, width: int, timestamp: str):
+        """Draw the timestamp at the top right of a frame"""
+        font_detail = self._load_font(self._font_sizes(width)[2])
+        ts_width = int(font_detail.getlength(timestamp))
+        ImageDraw.Draw(image).text((width - 10 - ts_width, 15), timestamp,
+                                   fill='black', font=font_detail)
+
+    def _draw(self, width: int, height: int, tricolor: bool, grayscale: bool,
+              displays: list) -> Image.Image:
+        """Draw the status frame, less its timestamp, for the given status data"""
+
+        # Create white background; grayscale unless red is needed, which
+        # the server converts to any panel without an RGB expansion
+        image = self.blank_canvas(width, height, 'RGB' if tricolor else 'L')
         draw = ImageDraw.Draw(image)
 
         # Calculate font sizes based on display size
-        if width >= 600:
-            title_size, name_size, detail_size = 28, 20, 16
-        elif width >= 400:
-            title_size, name_size, detail_size = 22, 16, 12
-        else:
-            title_size, name_size, detail_size = 18, 14, 10
+        title_size, name_size, detail_size = self._font_sizes(width)
 
         font_title = self._load_font(title_size)
         font_name = self._load_font(name_size)
@@ -142,24 +228,15 @@ class ScreenStatusPlugin(ContentPlugin):
         y = margin
 
         # Draw title
-        timestamp = datetime.now().strftime("%m/%d/%Y %I:%M %p")
         title_text = f"{self.title}"
         draw.text((margin, y), title_text, fill='black', font=font_title)
 
-        # Draw timestamp on right
-        ts_bbox = draw.textbbox((0, 0), timestamp, font=font_detail)
-        ts_width = ts_bbox[2] - ts_bbox[0]
-        draw.text((width - margin - ts_width, y + 5), timestamp, fill='black', font=font_detail)
-
         y += title_size + 10
 
         # Draw separator line
         draw.line([(margin, y), (width - margin, y)], fill='black', width=1)
         y += 10
 
-        # Get display status data
-        displays = self._get_status_data()
-
         if not displays:
             draw.text((margin, y), "No displays configured", fill='black', font=font_name)
             return image
@@ -178,7 +255,7 @@ class ScreenStatusPlugin(ContentPlugin):
             # Status indicator
             status_color = 'black' if display['online'] else ('red' if tricolor else 'black')
             indicator = "●" if display['online'] else "○"
-            draw.text((margin, y), indicator, fill=status_color, font=font_name)
+            image.paste(status_color, (margin, y), self._indicator_mask(name_size, indicator))
 
             # Display name and resolution/mode
             name_x = margin + 25
@@ -192,8 +269,7 @@ class ScreenStatusPlugin(ContentPlugin):
             # IP address (if enabled)
             if self.show_ip:
                 ip_text = display['ip']
-                ip_bbox = draw.textbbox((0, 0), ip_text, font=font_detail)
-                ip_width = ip_bbox[2] - ip_bbox[0]
+                ip_width = int(font_detail.getlength(ip_text))
                 draw.text((width - margin - ip_width, y + 2), ip_text,
                          fill='gray' if not tricolor and not grayscale else 'black',
                          font=font_detail)
@@ -201,13 +277,13 @@ class ScreenStatusPlugin(ContentPlugin):
             y += name_size + 4
 
             # Last success line
-            success_text = f"Last Success: {self._format_timestamp(display['last_success'])}"
+            success_text = f"Last Success: {_format_timestamp(display['last_success'])}"
             draw.text((name_x, y), success_text, fill='black', font=font_detail)
             y += detail_size + 2
 
             # Last error line (if any)
             if display['last_error']:
-                error_text = f"Last Error: {self._format_timestamp(display['last_error'])}"
+                error_text = f"Last Error: {_format_timestamp(display['last_error'])}"
                 error_color = 'red' if tricolor else 'black'
                 draw.text((name_x, y), error_text, fill=error_color, font=font_detail)
                 y += detail_size + 2
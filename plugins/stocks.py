@@ -7,7 +7,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
 from typing import Dict, Any, Optional
-from .base import ContentPlugin
+from .base import ContentPlugin, format_time
 
 
 class StockTickerPlugin(ContentPlugin):
@@ -29,6 +29,18 @@ class StockTickerPlugin(ContentPlugin):
         self.symbols = config.get('symbols', ['AAPL', 'GOOGL', 'MSFT', 'TSLA'])
         self.show_charts = config.get('show_charts', False)
 
+        # Fonts are loaded once and reused by every generate()
+        try:
+            self.title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 40)
+            self.symbol_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
+            self.price_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 28)
+            self.info_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
+        except Exception:
+            self.title_font = ImageFont.load_default()
+            self.symbol_font = ImageFont.load_default()
+            self.price_font = ImageFont.load_default()
+            self.info_font = ImageFont.load_default()
+
         # TODO: Add actual stock API integration (Alpha Vantage, Yahoo Finance, etc.)
         # For now, this is a mock implementation
 
@@ -42,49 +54,35 @@ class StockTickerPlugin(ContentPlugin):
         TODO: Implement actual API integration
         For now, returns mock data
         """
-        # Mock data for demonstration
-        import random
+        # Mock data for demonstration, drawn for all symbols at once the
+        # way a real API's price and change arrays would be handled
+        import numpy as np
         
-        stocks = []
-        for symbol in self.symbols:
-            price = random.uniform(100, 500)
-            change = random.uniform(-10, 10)
-            change_pct = (change / price) * 100
-            
-            stocks.append({
-                'symbol': symbol,
-                'price': price,
-                'change': change,
-                'change_pct': change_pct
-            })
+        count = len(self.symbols)
+        prices = np.random.uniform(100, 500, count)
+        changes = np.random.uniform(-10, 10, count)
+        change_pcts = changes / prices * 100
         
-        return stocks
+        return [
+            {'symbol': symbol, 'price': price, 'change': change, 'change_pct': change_pct}
+            for symbol, price, change, change_pct
+            in zip(self.symbols, prices.tolist(), changes.tolist(), change_pcts.tolist())
+        ]
     
     def generate(self, width, height, tricolor=False, grayscale=False):
         """Generate stock ticker display"""
-        # Create white background
-        image = Image.new('RGB', (width, height), 'white')
+        # Create white background; grayscale unless red is needed, which
+        # the server converts to any panel without an RGB expansion
+        image = self.blank_canvas(width, height, 'RGB' if tricolor else 'L')
         draw = ImageDraw.Draw(image)
         
-        # Try to load fonts
-        try:
-            title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 40)
-            symbol_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
-            price_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 28)
-            info_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 20)
-        except Exception:
-            title_font = ImageFont.load_default()
-            symbol_font = ImageFont.load_default()
-            price_font = ImageFont.load_default()
-            info_font = ImageFont.load_default()
-        
         # Draw title
         title = "Stock Market"
-        draw.text((20, 20), title, fill='black', font=title_font)
+        draw.text((20, 20), title, fill='black', font=self.title_font)
         
         # Draw timestamp
-        timestamp = datetime.now().strftime('%I:%M %p')
-        draw.text((width - 150, 30), timestamp, fill='black', font=info_font)
+        timestamp = format_time(datetime.now())
+        draw.text((width - 150, 30), timestamp, fill='black', font=self.info_font)
         
         # Draw line under title
         draw.line([(20, 80), (width - 20, 80)], fill='black', width=2)
@@ -109,15 +107,15 @@ class StockTickerPlugin(ContentPlugin):
                 color = 'black'
             
             # Draw symbol
-            draw.text((30, y), symbol, fill='black', font=symbol_font)
+            draw.text((30, y), symbol, fill='black', font=self.symbol_font)
             
             # Draw price
             price_text = f"${price:.2f}"
-            draw.text((180, y), price_text, fill='black', font=price_font)
+            draw.text((180, y), price_text, fill='black', font=self.price_font)
             
             # Draw change
             change_text = f"{change:+.2f} ({change_pct:+.2f}%)"
-            draw.text((350, y), change_text, fill=color, font=price_font)
+            draw.text((350, y), change_text, fill=color, font=self.price_font)
             
             # Draw separator line
             if stock != stocks[-1]:
@@ -128,7 +126,7 @@ class StockTickerPlugin(ContentPlugin):
         
         # Draw footer
         footer_text = "Market data delayed 15 minutes"
-        draw.text((20, height - 30), footer_text, fill='gray', font=info_font)
+        draw.text((20, height - 30), footer_text, fill='gray', font=self.info_font)
         
         return image
 
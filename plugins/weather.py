@@ -5,18 +5,28 @@ Displays current weather conditions using HTML rendering
 
 from pathlib import Path
 from PIL import Image
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from typing import Dict, Any, Optional
-from .base import ContentPlugin, PluginError
+from .base import BackgroundRenderPlugin, PluginError
 
 
-class WeatherPlugin(ContentPlugin):
+# First installed Chromium/Chrome binary, found once at import
+_BROWSER_PATH = next(
+    (path for path in ['/usr/bin/chromium', '/usr/bin/chromium-browser', '/usr/bin/google-chrome']
+     if Path(path).exists()),
+    None
+)
+
+
+class WeatherPlugin(BackgroundRenderPlugin):
     """
     Weather display plugin
     
     Renders weather-display.html using Chrome/Selenium
     Shows current conditions, temperature, and forecast
+
+    The page stays open in one tab and is reloaded for each update. A page
+    that sets window.__ready = true once it has drawn is captured right
+    away; otherwise the plugin waits render_timeout seconds (default 2).
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -27,7 +37,11 @@ class WeatherPlugin(ContentPlugin):
         if not self.html_path.exists():
             raise PluginError(f"Weather HTML not found: {self.html_path}")
 
+        self.render_timeout = config.get('render_timeout', 2)
+
         self.driver = None
+        self.window_size = None
+        self.page_loaded = False
 
     def get_description(self) -> str:
         return "Current weather conditions with forecast"
@@ -37,37 +51,53 @@ class WeatherPlugin(ContentPlugin):
         if self.driver:
             return self.driver
         
+        # Selenium pulls in a large dependency tree, so it is only imported
+        # once the plugin actually renders
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         
-        # Try to find chromium
-        for browser_path in ['/usr/bin/chromium', '/usr/bin/chromium-browser', '/usr/bin/google-chrome']:
-            if Path(browser_path).exists():
-                chrome_options.binary_location = browser_path
-                break
+        if _BROWSER_PATH:
+            chrome_options.binary_location = _BROWSER_PATH
         
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
+            self.window_size = None
+            self.page_loaded = False
             return self.driver
         except Exception as e:
             raise PluginError(f"Failed to setup Chrome: {e}")
     
-    def generate(self, width, height, tricolor=False, grayscale=False):
-        """Generate weather display"""
+    def render(self, width, height, tricolor=False, grayscale=False):
+        """Render weather display"""
         driver = self.setup_driver()
         
-        # Set window size
-        driver.set_window_size(width, height)
+        # Set window size (only when the target display changes)
+        if self.window_size != (width, height):
+            driver.set_window_size(width, height)
+            self.window_size = (width, height)
         
-        # Load HTML
-        driver.get(f'file://{self.html_path.absolute()}')
+        # Load HTML once, then reload the same tab
+        if self.page_loaded:
+            driver.refresh()
+        else:
+            driver.get(f'file://{self.html_path.absolute()}')
+            self.page_loaded = True
         
-        # Wait for rendering
-        import time
-        time.sleep(2)
+        # Wait for rendering: until the page flags itself ready, or the
+        # whole timeout for pages that don't
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        try:
+            WebDriverWait(driver, self.render_timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return window.__ready === true"))
+        except TimeoutException:
+            pass
         
         # Capture screenshot
         screenshot_bytes = driver.get_screenshot_as_png()
@@ -88,9 +118,11 @@ class WeatherPlugin(ContentPlugin):
     
     def cleanup(self):
         """Cleanup Chrome driver"""
+        super().cleanup()
         if self.driver:
             try:
                 self.driver.quit()
             except Exception:
                 pass
             self.driver = None
+            self.page_loaded = False
@@ -0,0 +1,48 @@
+"""
+Display Server Tests
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import socket
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from display_server import DisplayServer
+
+
+class QueryDisplayStatusTest(unittest.TestCase):
+    """Status probes against a display that accepts but never answers"""
+
+    def setUp(self):
+        # Listening socket that completes the TCP handshake but never replies
+        self.listener = socket.socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(8)
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.server = DisplayServer(output_dir=Path(self.output_dir.name))
+        self.server.register_display('hung', '127.0.0.1', self.listener.getsockname()[1],
+                                     250, 122)
+
+    def tearDown(self):
+        self.listener.close()
+        self.output_dir.cleanup()
+
+    def test_unresponsive_display_reports_timeout(self):
+        timeout = 1.0
+        start = time.monotonic()
+        status = self.server.query_display_status('hung', timeout=timeout)
+        elapsed = time.monotonic() - start
+
+        self.assertFalse(status['online'])
+        self.assertEqual(status['error'], "Timeout")
+        # Read timeouts aren't retried, so the probe takes about one timeout
+        self.assertLess(elapsed, timeout * 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,8 @@ Pin Configuration:
 """
 
 import network, socket, time, gc
-from machine import Pin, SPI
+from machine import Pin, SPI, idle
+from micropython import const
 
 gc.enable(); gc.collect()
 
@@ -29,76 +30,124 @@ SUBNET_MASK = "255.255.255.0"
 GATEWAY = "192.168.1.1"
 DNS_SERVER = "8.8.8.8"
 SERVER_PORT = 8080
-
-DISPLAY_WIDTH = 250
-DISPLAY_HEIGHT = 122
-EXPECTED_BYTES_BW = (DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8
-EXPECTED_BYTES_BWR = EXPECTED_BYTES_BW * 2
-
-spi = SPI(1, baudrate=4000000, polarity=0, phase=0, sck=Pin(10), mosi=Pin(11), miso=Pin(12))
+CLIENT_TIMEOUT = 10  # seconds a stalled client may hold the server
+
+DISPLAY_WIDTH = const(250)
+DISPLAY_HEIGHT = const(122)
+EXPECTED_BYTES_BW = const((DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8)
+EXPECTED_BYTES_BWR = const(EXPECTED_BYTES_BW * 2)
+FRAME_BUF = bytearray(EXPECTED_BYTES_BWR)  # reserved at boot, reused by every update
+INFO_RESPONSE = f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} BWR".encode()
+OK_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK"
+TOO_LARGE_RESPONSE = b"HTTP/1.1 413 Payload Too Large\r\nContent-Length: 0\r\n\r\n"
+_CONTENT_LENGTH = b'content-length:'  # header names, matched against lower-cased lines
+_CONTENT_ENCODING = b'content-encoding:'
+_WHITE = b'\xff' * EXPECTED_BYTES_BW  # clear plane, built once
+
+spi = SPI(1, baudrate=20000000, polarity=0, phase=0, sck=Pin(10), mosi=Pin(11), miso=Pin(12))
 rst, dc, cs, busy = Pin(12, Pin.OUT), Pin(8, Pin.OUT), Pin(9, Pin.OUT), Pin(13, Pin.IN)
+_CMD_BUF, _DATA_BUF = bytearray(1), bytearray(1)  # reused for single-byte writes
+# Init register writes: command byte, then its data bytes
+_INIT_PRE = (b'\x01\x03\x00\x2B\x2B\x03', b'\x06\x17\x17\x17')  # power, booster
+_INIT_POST = (b'\x00\x8F', b'\x50\x77', b'\x61\x00\xFA\x00\x7A')  # panel, VCOM, resolution
 
 def connect_wifi():
     wlan = network.WLAN(network.STA_IF); wlan.active(True)
     if not wlan.isconnected():
         wlan.connect(SSID, PASSWORD)
-        timeout = 10
-        while not wlan.isconnected() and timeout > 0: time.sleep(1); timeout -= 1
+        delay = 0.1; end = time.ticks_add(time.ticks_ms(), 10000)  # probe fast, then back off
+        while not wlan.isconnected() and time.ticks_diff(end, time.ticks_ms()) > 0: time.sleep(delay); delay = min(2.0, delay * 1.6)
     if wlan.isconnected():
         if USE_STATIC_IP: wlan.ifconfig((STATIC_IP, SUBNET_MASK, GATEWAY, DNS_SERVER))
         print(f"✓ {wlan.ifconfig()[0]}:{SERVER_PORT}"); return True
     return False
 
-def cmd(c): dc.value(0); cs.value(0); spi.write(bytearray([c])); cs.value(1)
-def data(d): dc.value(1); cs.value(0); spi.write(bytearray([d]) if isinstance(d, int) else d); cs.value(1)
-def wait(): timeout = 10; start = time.time(); [time.sleep_ms(100) for _ in range(100) if busy.value() == 1 and time.time() - start < timeout]
+def cmd(c): _CMD_BUF[0] = c; dc.value(0); cs.value(0); spi.write(_CMD_BUF); cs.value(1)
+def data(d):
+    if isinstance(d, int): _DATA_BUF[0] = d; d = _DATA_BUF
+    dc.value(1); cs.value(0); spi.write(d); cs.value(1)
+def send(b):  # command byte, then its data, in one CS transaction
+    mv = memoryview(b); dc.value(0); cs.value(0); spi.write(mv[:1]); dc.value(1); spi.write(mv[1:]); cs.value(1)
+_busy_done = False  # set by the BUSY falling-edge IRQ; wait() idles the core until then
+def _busy_isr(p):
+    global _busy_done; _busy_done = True
+busy.irq(trigger=Pin.IRQ_FALLING, handler=_busy_isr)
+def wait():
+    global _busy_done; _busy_done = False; deadline = time.ticks_add(time.ticks_ms(), 10000)
+    if busy.value() == 1:  # sleep until the IRQ; an idle panel has no edge to come
+        while not _busy_done and time.ticks_diff(deadline, time.ticks_ms()) > 0: idle()
 
 def epd_init():
     print("Init 2.13\" B...")
     rst.value(1); time.sleep_ms(200); rst.value(0); time.sleep_ms(2); rst.value(1); time.sleep_ms(200); wait()
-    cmd(0x01); data(0x03); data(0x00); data(0x2B); data(0x2B); data(0x03)
-    cmd(0x06); data(0x17); data(0x17); data(0x17)
+    for b in _INIT_PRE: send(b)
     cmd(0x04); wait()
-    cmd(0x00); data(0x8F)
-    cmd(0x50); data(0x77)
-    cmd(0x61); data(0x00); data(0xFA); data(0x00); data(0x7A)
+    for b in _INIT_POST: send(b)
     print("✓ Init OK")
 
 def epd_display(img_data):
     is_bw = len(img_data) == EXPECTED_BYTES_BW; is_bwr = len(img_data) == EXPECTED_BYTES_BWR
     if not (is_bw or is_bwr): print(f"✗ Invalid: {len(img_data)}"); return
     print(f"Display ({'B&W' if is_bw else 'BWR'})...")
-    white = bytearray([0xFF] * 500)
-    cmd(0x10); [data(white) for i in range(0, EXPECTED_BYTES_BW, 500)]
-    cmd(0x13); bw_data = img_data[:EXPECTED_BYTES_BW] if is_bwr else img_data; [data(bw_data[i:i+500]) for i in range(0, len(bw_data), 500)]
+    cmd(0x10); data(_WHITE)
+    mv = memoryview(img_data); cmd(0x13); data(mv[:EXPECTED_BYTES_BW] if is_bwr else mv)
     cmd(0x14)
-    if is_bwr: red_data = img_data[EXPECTED_BYTES_BW:]; [data(red_data[i:i+500]) for i in range(0, len(red_data), 500)]
-    else: [data(white) for i in range(0, EXPECTED_BYTES_BW, 500)]
+    if is_bwr: data(mv[EXPECTED_BYTES_BW:])
+    else: data(_WHITE)
     cmd(0x12); wait(); print("✓ Done")
 
 def epd_sleep(): cmd(0x02); wait(); cmd(0x07); data(0xA5)
 
+def inflate(sock, out):
+    import deflate  # gzip body, read off the socket (MicroPython 1.21+)
+    s = deflate.DeflateIO(sock, deflate.GZIP); n = 0
+    while n < len(out):
+        r = s.readinto(out[n:])
+        if not r: break
+        n += r
+    return out[:n]
+
 def handle_request(conn):
     try:
-        req = b""; cl = 0; hd = False; body = b""
-        while not hd:
-            chunk = conn.recv(512)
-            if not chunk: break
-            req += chunk
-            if b'\r\n\r\n' in req:
-                hd = True; he = req.find(b'\r\n\r\n'); headers = req[:he]; body = req[he + 4:]
-                for line in headers.split(b'\r\n'):
-                    if line.startswith(b'Content-Length:'): cl = int(line.split(b':')[1].strip()); break
-                if b'POST /update' not in headers: conn.send(f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} BWR".encode()); return
-        while len(body) < cl: chunk = conn.recv(min(1024, cl - len(body))); [body := body + chunk for _ in [0] if chunk]
-        conn.send(b"HTTP/1.1 200 OK\r\n\r\nOK"); del req, headers; gc.collect()
-        epd_display(body); time.sleep(1); epd_sleep(); del body; gc.collect()
+        req = conn.readline(); cl = 0; gz = False  # request line, then headers up to the blank line
+        while True:
+            line = conn.readline()
+            if not line: return
+            if line == b'\r\n': break
+            line = line.lower()
+            if line.startswith(_CONTENT_LENGTH): cl = int(line[15:].strip())
+            elif line.startswith(_CONTENT_ENCODING): gz = b'gzip' in line
+        if not req.startswith(b'POST /update'): conn.send(INFO_RESPONSE); return
+        if gz: view = inflate(conn, memoryview(FRAME_BUF))  # straight off the socket, never buffered
+        elif cl <= len(FRAME_BUF):
+            view = memoryview(FRAME_BUF)[:cl]; n = 0
+            while n < cl:
+                r = conn.readinto(view[n:])
+                if not r: break
+                n += r
+            if n < cl: return
+        else: print(f"✗ Invalid: {cl}"); conn.send(TOO_LARGE_RESPONSE); return
+        conn.send(OK_RESPONSE); del req
+        epd_display(view); time.sleep(1); epd_sleep(); del view; gc.collect()
     except Exception as e: print(f"✗ {e}")
-    finally: [conn.close() for _ in [0]]; gc.collect()
+    finally:
+        try: conn.close()
+        except: pass
 
 def start_server():
     addr = socket.getaddrinfo('0.0.0.0', SERVER_PORT)[0][-1]; s = socket.socket(); s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(addr); s.listen(1); print("✓ Server running")
-    while True: [handle_request(conn) for conn, addr in [s.accept()]] if True else None
-
-if __name__ == "__main__": print(f"\n{DISPLAY_WIDTH}x{DISPLAY_HEIGHT} Display\n"); [start_server() for _ in [0] if connect_wifi() and epd_init() is None]
+    nodelay = hasattr(socket, 'TCP_NODELAY')  # flush small responses at once (newer builds)
+    while True:
+        try:
+            conn, addr = s.accept()
+            conn.settimeout(CLIENT_TIMEOUT)
+            if nodelay: conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            handle_request(conn)
+        except Exception as e: print(f"✗ {e}"); gc.collect()
+
+if __name__ == "__main__":
+    print(f"\n{DISPLAY_WIDTH}x{DISPLAY_HEIGHT} Display\n")
+    if connect_wifi():
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())  # collect on allocation pressure
+        epd_init(); start_server()
@@ -19,7 +19,8 @@ Pin Configuration:
 import network
 import socket
 import time
-from machine import Pin, SPI
+from machine import Pin, SPI, mem32, idle
+from micropython import const
 import gc
 
 gc.enable()
@@ -36,19 +37,31 @@ GATEWAY = "192.168.1.1"
 DNS_SERVER = "8.8.8.8"
 
 SERVER_PORT = 8080
+CLIENT_TIMEOUT = 10  # seconds a stalled client may hold the server
 # ==================================
 
-DISPLAY_WIDTH = 264
-DISPLAY_HEIGHT = 176
-EXPECTED_BYTES_BW = (DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8      # 5,808 bytes (1 bpp)
-EXPECTED_BYTES_GRAY = (DISPLAY_WIDTH * DISPLAY_HEIGHT) // 4    # 11,616 bytes (2 bpp)
+DISPLAY_WIDTH = const(264)
+DISPLAY_HEIGHT = const(176)
+EXPECTED_BYTES_BW = const((DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8)      # 5,808 bytes (1 bpp)
+EXPECTED_BYTES_GRAY = const((DISPLAY_WIDTH * DISPLAY_HEIGHT) // 4)    # 11,616 bytes (2 bpp)
+
+# Frame buffer reserved once at boot, while the heap is still unfragmented;
+# every update is received (or inflated) straight into it
+FRAME_BUF = bytearray(EXPECTED_BYTES_GRAY)
+
+# Responses never change, so they are encoded once at boot
+INFO_RESPONSE = f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} GRAY".encode()
+OK_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK"
+TOO_LARGE_RESPONSE = b"HTTP/1.1 413 Payload Too Large\r\nContent-Length: 0\r\n\r\n"
+_CONTENT_LENGTH = b'content-length:'  # header names, matched against lower-cased lines
+_CONTENT_ENCODING = b'content-encoding:'
 
 EPD_RST_PIN = 12
 EPD_DC_PIN = 8
 EPD_CS_PIN = 9
 EPD_BUSY_PIN = 13
 
-spi = SPI(1, baudrate=4000000, polarity=0, phase=0,
+spi = SPI(1, baudrate=20000000, polarity=0, phase=0,
           sck=Pin(10), mosi=Pin(11), miso=Pin(12))
 
 rst = Pin(EPD_RST_PIN, Pin.OUT)
@@ -56,6 +69,38 @@ dc = Pin(EPD_DC_PIN, Pin.OUT)
 cs = Pin(EPD_CS_PIN, Pin.OUT)
 busy = Pin(EPD_BUSY_PIN, Pin.IN)
 
+# One-byte buffers reused by every command/register write
+_CMD_BUF = bytearray(1)
+_DATA_BUF = bytearray(1)
+
+# SPI1 registers and DREQ for DMA frame pushes (RP2040 datasheet 2.5.3, 4.4.4)
+_SPI1_SSPDR = const(0x40040008)
+_SPI1_SSPSR = const(0x4004000C)
+_SSPSR_BSY = const(0x10)
+_DREQ_SPI1_TX = const(18)
+
+# Frame pushes go through a DMA channel paced by the SPI TX DREQ, so the CPU
+# is free for a GC pass while the plane is clocked out. Falls back to a
+# blocking spi.write() on firmware without rp2.DMA (before MicroPython 1.22).
+try:
+    import rp2
+    _dma = rp2.DMA()
+    _DMA_CTRL = _dma.pack_ctrl(size=0, inc_read=True, inc_write=False,
+                               treq_sel=_DREQ_SPI1_TX)
+except (ImportError, AttributeError):
+    _dma = None
+
+# Init register writes, each a command byte followed by its data bytes
+_INIT_BEFORE_POWER_ON = (
+    b'\x01\x03\x00\x2B\x2B',  # Power setting
+    b'\x06\x17\x17\x17',      # Booster soft start
+)
+_INIT_AFTER_POWER_ON = (
+    b'\x00\x8F',              # Panel setting
+    b'\x50\x77',              # VCOM and data interval
+    b'\x61\x01\x08\x00\xB0',  # Resolution 264x176
+)
+
 
 def show_memory():
     free = gc.mem_free()
@@ -70,11 +115,14 @@ def connect_wifi():
     if not wlan.isconnected():
         print(f"Connecting to {SSID}...")
         wlan.connect(SSID, PASSWORD)
-        timeout = 10
-        while not wlan.isconnected() and timeout > 0:
+        # Probe quickly at first and back off, so a fast association is
+        # seen within ~100 ms instead of on the next whole second
+        delay = 0.1
+        deadline = time.ticks_add(time.ticks_ms(), 10000)
+        while not wlan.isconnected() and time.ticks_diff(deadline, time.ticks_ms()) > 0:
             print(".", end="")
-            time.sleep(1)
-            timeout -= 1
+            time.sleep(delay)
+            delay = min(2.0, delay * 1.6)
         print()
 
     if wlan.isconnected():
@@ -90,23 +138,71 @@ def connect_wifi():
 def epd_send_command(cmd):
     dc.value(0)
     cs.value(0)
-    spi.write(bytearray([cmd]))
+    _CMD_BUF[0] = cmd
+    spi.write(_CMD_BUF)
     cs.value(1)
 
 
 def epd_send_data(data):
     dc.value(1)
     cs.value(0)
-    spi.write(bytearray([data]) if isinstance(data, int) else data)
+    if isinstance(data, int):
+        _DATA_BUF[0] = data
+        data = _DATA_BUF
+    spi.write(data)
     cs.value(1)
 
 
+def epd_send_frame(data):
+    """Send a frame plane, running a GC pass while DMA transfers it"""
+    if _dma is None:
+        epd_send_data(data)
+        gc.collect()
+        return
+    dc.value(1)
+    cs.value(0)
+    _dma.config(read=data, write=_SPI1_SSPDR, count=len(data),
+                ctrl=_DMA_CTRL, trigger=True)
+    gc.collect()
+    while _dma.active():
+        pass
+    # DMA is done once the FIFO is fed; CS must stay low until it drains
+    while mem32[_SPI1_SSPSR] & _SSPSR_BSY:
+        pass
+    cs.value(1)
+
+
+def epd_send_blob(blob):
+    mv = memoryview(blob)
+    dc.value(0)
+    cs.value(0)
+    spi.write(mv[:1])
+    dc.value(1)
+    spi.write(mv[1:])
+    cs.value(1)
+
+
+# Set by the BUSY falling-edge IRQ. epd_wait_busy() sleeps the core with
+# machine.idle() until it is set instead of polling the pin
+_busy_done = False
+
+
+def _busy_isr(pin):
+    global _busy_done
+    _busy_done = True
+
+
+busy.irq(trigger=Pin.IRQ_FALLING, handler=_busy_isr)
+
+
 def epd_wait_busy():
-    timeout = 10
-    start = time.time()
-    while busy.value() == 1 and time.time() - start < timeout:
-        time.sleep_ms(100)
-    return time.time() - start < timeout
+    global _busy_done
+    _busy_done = False
+    deadline = time.ticks_add(time.ticks_ms(), 10000)
+    if busy.value() == 1:  # else already idle, with no falling edge to come
+        while not _busy_done and time.ticks_diff(deadline, time.ticks_ms()) > 0:
+            idle()
+    return time.ticks_diff(deadline, time.ticks_ms()) > 0
 
 
 def epd_reset():
@@ -129,37 +225,12 @@ def epd_init():
     epd_reset()
     epd_wait_busy()
 
-    # Panel setting
-    epd_send_command(0x01)
-    epd_send_data(0x03)
-    epd_send_data(0x00)
-    epd_send_data(0x2B)
-    epd_send_data(0x2B)
-
-    # Booster soft start
-    epd_send_command(0x06)
-    epd_send_data(0x17)
-    epd_send_data(0x17)
-    epd_send_data(0x17)
-
-    # Power on
-    epd_send_command(0x04)
+    for blob in _INIT_BEFORE_POWER_ON:
+        epd_send_blob(blob)
+    epd_send_command(0x04)  # Power on
     epd_wait_busy()
-
-    # Panel setting
-    epd_send_command(0x00)
-    epd_send_data(0x8F)
-
-    # VCOM and data interval
-    epd_send_command(0x50)
-    epd_send_data(0x77)
-
-    # Resolution setting: 264x176
-    epd_send_command(0x61)
-    epd_send_data(0x01)  # 264 = 0x108
-    epd_send_data(0x08)
-    epd_send_data(0x00)  # 176 = 0xB0
-    epd_send_data(0xB0)
+    for blob in _INIT_AFTER_POWER_ON:
+        epd_send_blob(blob)
 
     print("✓ Initialized")
 
@@ -170,8 +241,7 @@ def epd_display_bw(data):
 
     # Send B&W data
     epd_send_command(0x10)
-    for i in range(0, len(data), 1000):
-        epd_send_data(data[i:i+1000])
+    epd_send_frame(data)
 
     # Refresh
     epd_send_command(0x12)
@@ -200,8 +270,7 @@ def epd_display_gray(data):
 
     # Send grayscale data (2 bits per pixel packed into bytes)
     epd_send_command(0x10)
-    for i in range(0, len(data), 1000):
-        epd_send_data(data[i:i+1000])
+    epd_send_frame(data)
 
     # Refresh
     epd_send_command(0x12)
@@ -230,49 +299,75 @@ def epd_sleep():
     epd_send_data(0xA5)
 
 
+def inflate(sock, out):
+    """Inflate a gzip body off the socket into out, returning the filled part"""
+    import deflate  # MicroPython 1.21+
+    stream = deflate.DeflateIO(sock, deflate.GZIP)
+    n = 0
+    while n < len(out):
+        r = stream.readinto(out[n:])
+        if not r:
+            break
+        n += r
+    return out[:n]
+
+
 def handle_request(conn, addr):
     try:
-        request = b""
+        # Request line, then headers one line at a time up to the blank
+        # line, so the body is never copied out of a header buffer
+        request = conn.readline()
         content_length = 0
-        headers_done = False
-        body = b""
-
-        while not headers_done:
-            chunk = conn.recv(512)
-            if not chunk:
+        gzipped = False
+        while True:
+            line = conn.readline()
+            if not line:
+                return
+            if line == b'\r\n':
                 break
-            request += chunk
-            if b'\r\n\r\n' in request:
-                headers_done = True
-                header_end = request.find(b'\r\n\r\n')
-                headers = request[:header_end]
-                body = request[header_end + 4:]
-
-                for line in headers.split(b'\r\n'):
-                    if line.startswith(b'Content-Length:'):
-                        content_length = int(line.split(b':')[1].strip())
-                        break
-
-                if b'POST /update' not in headers:
-                    conn.send(f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} GRAY".encode())
-                    return
-
-        while len(body) < content_length:
-            chunk = conn.recv(min(1024, content_length - len(body)))
-            if not chunk:
-                break
-            body += chunk
-
-        conn.send(b"HTTP/1.1 200 OK\r\n\r\nOK")
-        del request, headers
-        gc.collect()
-
-        epd_display_image(body)
+            line = line.lower()
+            if line.startswith(_CONTENT_LENGTH):
+                content_length = int(line[15:].strip())
+            elif line.startswith(_CONTENT_ENCODING):
+                gzipped = b'gzip' in line
+        
+        if not request.startswith(b'POST /update'):
+            conn.send(INFO_RESPONSE)
+            return
+        
+        if content_length == 0:
+            return
+        
+        # Server sends gzip when the display has 'compress': True. It is
+        # inflated straight off the socket into FRAME_BUF, so the compressed
+        # body is never buffered
+        if gzipped:
+            view = inflate(conn, memoryview(FRAME_BUF))
+        elif content_length <= len(FRAME_BUF):
+            # Receive straight into the frame buffer
+            view = memoryview(FRAME_BUF)[:content_length]
+            offset = 0
+            while offset < content_length:
+                n = conn.readinto(view[offset:])
+                if not n:
+                    break
+                offset += n
+
+            if offset < content_length:
+                return
+        else:
+            print(f"✗ Invalid size: {content_length} bytes")
+            conn.send(TOO_LARGE_RESPONSE)
+            return
+        
+        conn.send(OK_RESPONSE)
+        del request
+
+        epd_display_image(view)
         time.sleep(2)
         epd_sleep()
 
-        del body
-        gc.collect()
+        del view
     except Exception as e:
         print(f"✗ {e}")
     finally:
@@ -280,7 +375,6 @@ def handle_request(conn, addr):
             conn.close()
         except:
             pass
-        gc.collect()
 
 
 def start_server():
@@ -289,6 +383,9 @@ def start_server():
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(addr)
     s.listen(1)
+    # Flush each small response at once instead of letting Nagle hold it
+    # back (the option is missing on older MicroPython builds)
+    nodelay = hasattr(socket, 'TCP_NODELAY')
 
     print("✓ Server running")
     show_memory()
@@ -296,6 +393,9 @@ def start_server():
     while True:
         try:
             conn, addr = s.accept()
+            conn.settimeout(CLIENT_TIMEOUT)
+            if nodelay:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             handle_request(conn, addr)
         except Exception as e:
             print(f"✗ {e}")
@@ -305,6 +405,8 @@ def start_server():
 def main():
     print(f"\nGeneric Display ({DISPLAY_WIDTH}x{DISPLAY_HEIGHT} Grayscale)\n")
     if connect_wifi():
+        # Collect on allocation pressure rather than explicitly on every request
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
         epd_init()
         start_server()
 
@@ -16,7 +16,8 @@ Pin Configuration:
 import network
 import socket
 import time
-from machine import Pin, SPI
+from machine import Pin, SPI, mem32, idle
+from micropython import const
 import gc
 
 gc.enable()
@@ -34,12 +35,25 @@ GATEWAY = "192.168.1.1"
 DNS_SERVER = "8.8.8.8"
 
 SERVER_PORT = 8080
+CLIENT_TIMEOUT = 10  # seconds a stalled client may hold the server
+VERBOSE = False  # print upload progress and per-request memory use
 # ==================================
 
 # Display Configuration
-DISPLAY_WIDTH = 648
-DISPLAY_HEIGHT = 480
-EXPECTED_BYTES = (DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8  # 38,880 bytes (B&W)
+DISPLAY_WIDTH = const(648)
+DISPLAY_HEIGHT = const(480)
+EXPECTED_BYTES = const((DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8)  # 38,880 bytes (B&W)
+
+# Frame buffer reserved once at boot, while the heap is still unfragmented;
+# every update is received (or inflated) straight into it
+FRAME_BUF = bytearray(EXPECTED_BYTES)
+
+# Responses never change, so they are encoded once at boot
+INFO_RESPONSE = f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} BW".encode()
+OK_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK"
+TOO_LARGE_RESPONSE = b"HTTP/1.1 413 Payload Too Large\r\nContent-Length: 0\r\n\r\n"
+_CONTENT_LENGTH = b'content-length:'  # header names, matched against lower-cased lines
+_CONTENT_ENCODING = b'content-encoding:'
 
 # Pin Configuration
 EPD_RST_PIN = 12
@@ -48,7 +62,7 @@ EPD_CS_PIN = 9
 EPD_BUSY_PIN = 13
 
 # SPI Configuration
-spi = SPI(1, baudrate=4000000, polarity=0, phase=0, 
+spi = SPI(1, baudrate=20000000, polarity=0, phase=0, 
           sck=Pin(10), mosi=Pin(11), miso=Pin(12))
 
 # Initialize pins
@@ -57,6 +71,41 @@ dc = Pin(EPD_DC_PIN, Pin.OUT)
 cs = Pin(EPD_CS_PIN, Pin.OUT)
 busy = Pin(EPD_BUSY_PIN, Pin.IN)
 
+# One-byte buffers reused by every command/register write
+_CMD_BUF = bytearray(1)
+_DATA_BUF = bytearray(1)
+
+# SPI1 registers and DREQ for DMA frame pushes (RP2040 datasheet 2.5.3, 4.4.4)
+_SPI1_SSPDR = const(0x40040008)
+_SPI1_SSPSR = const(0x4004000C)
+_SSPSR_BSY = const(0x10)
+_DREQ_SPI1_TX = const(18)
+
+# Frame pushes go through a DMA channel paced by the SPI TX DREQ, so the CPU
+# is free for a GC pass while the plane is clocked out. Falls back to a
+# blocking spi.write() on firmware without rp2.DMA (before MicroPython 1.22).
+try:
+    import rp2
+    _dma = rp2.DMA()
+    _DMA_CTRL = _dma.pack_ctrl(size=0, inc_read=True, inc_write=False,
+                               treq_sel=_DREQ_SPI1_TX)
+except (ImportError, AttributeError):
+    _dma = None
+
+# Init register writes, each a command byte followed by its data bytes
+_INIT_BEFORE_POWER_ON = (
+    b'\x01\x37\x00',      # Power setting
+    b'\x00\xCF\x08',      # Panel setting
+    b'\x06\xC7\xCC\x28',  # Booster soft start
+)
+_INIT_AFTER_POWER_ON = (
+    b'\x30\x3C',              # PLL control
+    b'\x41\x00',              # Temperature sensor
+    b'\x50\x77',              # VCOM and data interval
+    b'\x61\x02\x88\x01\xE0',  # Resolution 648x480
+    b'\x82\x0A',              # VCOM DC
+)
+
 
 def show_memory():
     """Show current memory usage"""
@@ -75,11 +124,14 @@ def connect_wifi():
         print(f"Connecting to WiFi: {SSID}")
         wlan.connect(SSID, PASSWORD)
         
-        timeout = 10
-        while not wlan.isconnected() and timeout > 0:
+        # Probe quickly at first and back off, so a fast association is
+        # seen within ~100 ms instead of on the next whole second
+        delay = 0.1
+        deadline = time.ticks_add(time.ticks_ms(), 10000)
+        while not wlan.isconnected() and time.ticks_diff(deadline, time.ticks_ms()) > 0:
             print(".", end="")
-            time.sleep(1)
-            timeout -= 1
+            time.sleep(delay)
+            delay = min(2.0, delay * 1.6)
         print()
     
     if wlan.isconnected():
@@ -107,7 +159,8 @@ def epd_send_command(command):
     """Send command to e-paper display"""
     dc.value(0)
     cs.value(0)
-    spi.write(bytearray([command]))
+    _CMD_BUF[0] = command
+    spi.write(_CMD_BUF)
     cs.value(1)
 
 
@@ -115,7 +168,8 @@ def epd_send_data(data):
     """Send data to e-paper display"""
     dc.value(1)
     cs.value(0)
-    spi.write(bytearray([data]))
+    _DATA_BUF[0] = data
+    spi.write(_DATA_BUF)
     cs.value(1)
 
 
@@ -127,16 +181,61 @@ def epd_send_data_bytes(data):
     cs.value(1)
 
 
+def epd_send_frame(data):
+    """Send a frame plane, running a GC pass while DMA transfers it"""
+    if _dma is None:
+        epd_send_data_bytes(data)
+        gc.collect()
+        return
+    dc.value(1)
+    cs.value(0)
+    _dma.config(read=data, write=_SPI1_SSPDR, count=len(data),
+                ctrl=_DMA_CTRL, trigger=True)
+    gc.collect()
+    while _dma.active():
+        pass
+    # DMA is done once the FIFO is fed; CS must stay low until it drains
+    while mem32[_SPI1_SSPSR] & _SSPSR_BSY:
+        pass
+    cs.value(1)
+
+
+def epd_send_blob(blob):
+    """Send a command byte and its data bytes in one CS transaction"""
+    mv = memoryview(blob)
+    dc.value(0)
+    cs.value(0)
+    spi.write(mv[:1])
+    dc.value(1)
+    spi.write(mv[1:])
+    cs.value(1)
+
+
+# Set by the BUSY falling-edge IRQ. epd_wait_busy() sleeps the core with
+# machine.idle() until it is set instead of polling the pin
+_busy_done = False
+
+
+def _busy_isr(pin):
+    global _busy_done
+    _busy_done = True
+
+
+busy.irq(trigger=Pin.IRQ_FALLING, handler=_busy_isr)
+
+
 def epd_wait_busy():
     """Wait until display is not busy"""
+    global _busy_done
+    _busy_done = False
     print("  Waiting for display ready...", end="")
-    timeout = 10
-    start = time.time()
-    while busy.value() == 1:
-        if time.time() - start > timeout:
-            print(" timeout")
-            return False
-        time.sleep_ms(100)
+    deadline = time.ticks_add(time.ticks_ms(), 10000)
+    if busy.value() == 1:  # else already idle, with no falling edge to come
+        while not _busy_done:
+            if time.ticks_diff(deadline, time.ticks_ms()) < 0:
+                print(" timeout")
+                return False
+            idle()
     print(" ✓")
     return True
 
@@ -157,48 +256,12 @@ def epd_init():
     epd_reset()
     epd_wait_busy()
     
-    # Panel setting
-    epd_send_command(0x01)
-    epd_send_data(0x37)
-    epd_send_data(0x00)
-    
-    # Power setting
-    epd_send_command(0x00)
-    epd_send_data(0xCF)
-    epd_send_data(0x08)
-    
-    # PLL control
-    epd_send_command(0x06)
-    epd_send_data(0xC7)
-    epd_send_data(0xCC)
-    epd_send_data(0x28)
-    
-    # Power on
-    epd_send_command(0x04)
+    for blob in _INIT_BEFORE_POWER_ON:
+        epd_send_blob(blob)
+    epd_send_command(0x04)  # Power on
     epd_wait_busy()
-    
-    # Panel setting
-    epd_send_command(0x30)
-    epd_send_data(0x3C)
-    
-    # Temperature sensor
-    epd_send_command(0x41)
-    epd_send_data(0x00)
-    
-    # VCOM and data interval setting
-    epd_send_command(0x50)
-    epd_send_data(0x77)
-    
-    # Resolution setting
-    epd_send_command(0x61)
-    epd_send_data(0x02)  # 648
-    epd_send_data(0x88)
-    epd_send_data(0x01)  # 480
-    epd_send_data(0xE0)
-    
-    # VCM_DC setting
-    epd_send_command(0x82)
-    epd_send_data(0x0A)
+    for blob in _INIT_AFTER_POWER_ON:
+        epd_send_blob(blob)
     
     print("✓ Display initialized")
 
@@ -215,12 +278,7 @@ def epd_display_image(image_data):
     # Send image data
     print("  Writing image data...")
     epd_send_command(0x10)
-    for i in range(0, len(image_data), 1000):
-        chunk = image_data[i:i+1000]
-        epd_send_data_bytes(chunk)
-        if i % 10000 == 0:
-            print(f"    {i*100//len(image_data)}%")
-    print("    100%")
+    epd_send_frame(image_data)
     
     # Refresh display
     print("  Refreshing...")
@@ -241,73 +299,91 @@ def epd_sleep():
     print("  ✓ Display in deep sleep")
 
 
+def inflate(sock, out):
+    """Inflate a gzip body off the socket into out, returning the filled part"""
+    import deflate  # MicroPython 1.21+
+    stream = deflate.DeflateIO(sock, deflate.GZIP)
+    n = 0
+    while n < len(out):
+        r = stream.readinto(out[n:])
+        if not r:
+            break
+        n += r
+    return out[:n]
+
+
 def handle_request(conn, addr):
     """Handle HTTP request"""
     print(f"\n{'='*60}")
     print(f"Connection from {addr}")
-    show_memory()
+    if VERBOSE:
+        show_memory()
     
     try:
-        request = b""
+        # Request line, then headers one line at a time up to the blank
+        # line, so the body is never copied out of a header buffer
+        request = conn.readline()
         content_length = 0
-        headers_done = False
-        body = b""
-        
-        # Read headers
-        while not headers_done:
-            chunk = conn.recv(512)
-            if not chunk:
+        gzipped = False
+        while True:
+            line = conn.readline()
+            if not line:
+                return
+            if line == b'\r\n':
                 break
-            request += chunk
-            if b'\r\n\r\n' in request:
-                headers_done = True
-                header_end = request.find(b'\r\n\r\n')
-                headers = request[:header_end]
-                body = request[header_end + 4:]
-                
-                for line in headers.split(b'\r\n'):
-                    if line.startswith(b'Content-Length:'):
-                        content_length = int(line.split(b':')[1].strip())
-                        break
-                
-                if b'POST /update' not in headers:
-                    conn.send(f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} BW".encode())
-                    return
+            line = line.lower()
+            if line.startswith(_CONTENT_LENGTH):
+                content_length = int(line[15:].strip())
+            elif line.startswith(_CONTENT_ENCODING):
+                gzipped = b'gzip' in line
         
-        if not headers_done or content_length == 0:
+        if not request.startswith(b'POST /update'):
+            conn.send(INFO_RESPONSE)
+            return
+        
+        if content_length == 0:
             print("✗ Invalid request")
             return
         
         print(f"Receiving: {content_length} bytes...")
         
-        # Read remaining body
-        while len(body) < content_length:
-            remaining = content_length - len(body)
-            chunk = conn.recv(min(1024, remaining))
-            if not chunk:
-                break
-            body += chunk
+        # Server sends gzip when the display has 'compress': True. It is
+        # inflated straight off the socket into FRAME_BUF, so the compressed
+        # body is never buffered
+        if gzipped:
+            view = inflate(conn, memoryview(FRAME_BUF))
+            print(f"✓ Inflated to {len(view)} bytes")
+        elif content_length <= len(FRAME_BUF):
+            # Receive straight into the frame buffer
+            view = memoryview(FRAME_BUF)[:content_length]
+            offset = 0
+            while offset < content_length:
+                n = conn.readinto(view[offset:])
+                if not n:
+                    break
+                offset += n
+                
+                if VERBOSE and offset % 10000 == 0:
+                    print(f"  {offset*100//content_length}%")
+
+            if offset < content_length:
+                print(f"✗ Incomplete")
+                return
             
-            if len(body) % 10000 == 0:
-                print(f"  {len(body)*100//content_length}%")
-        
-        if len(body) < content_length:
-            print(f"✗ Incomplete")
+            print(f"✓ Received")
+        else:
+            print(f"✗ Invalid size: {content_length} bytes")
+            conn.send(TOO_LARGE_RESPONSE)
             return
         
-        print(f"✓ Received")
-        
         # Send response
-        response = "HTTP/1.1 200 OK\r\n\r\nOK"
-        conn.send(response.encode())
+        conn.send(OK_RESPONSE)
         
         # Clean up
         del request
-        del headers
-        gc.collect()
         
         # Display image
-        epd_display_image(body)
+        epd_display_image(view)
         
         # Wait for display to stabilize
         print("  Waiting for display to stabilize...")
@@ -317,11 +393,11 @@ def handle_request(conn, addr):
         epd_sleep()
         
         # Clean up
-        del body
-        gc.collect()
+        del view
         
         print("✓ Complete!")
-        show_memory()
+        if VERBOSE:
+            show_memory()
         print(f"{'='*60}\n")
         
     except MemoryError as e:
@@ -334,7 +410,6 @@ def handle_request(conn, addr):
             conn.close()
         except:
             pass
-        gc.collect()
 
 
 def start_server():
@@ -344,6 +419,9 @@ def start_server():
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(addr)
     s.listen(1)
+    # Flush each small response at once instead of letting Nagle hold it
+    # back (the option is missing on older MicroPython builds)
+    nodelay = hasattr(socket, 'TCP_NODELAY')
     
     print(f"\n{'='*60}")
     print("✓ Server running")
@@ -354,8 +432,10 @@ def start_server():
     while True:
         try:
             conn, addr = s.accept()
+            conn.settimeout(CLIENT_TIMEOUT)
+            if nodelay:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             handle_request(conn, addr)
-            gc.collect()
         except Exception as e:
             print(f"✗ {e}")
             gc.collect()
@@ -376,6 +456,9 @@ def main():
         print("\n✗ Cannot start without WiFi")
         return
     
+    # Collect on allocation pressure rather than explicitly on every request
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+    
     try:
         epd_init()
     except Exception as e:
@@ -19,7 +19,8 @@ Pin Configuration:
 import network
 import socket
 import time
-from machine import Pin, SPI
+from machine import Pin, SPI, mem32, idle
+from micropython import const
 import gc
 
 gc.enable()
@@ -37,13 +38,30 @@ GATEWAY = "192.168.1.1"
 DNS_SERVER = "8.8.8.8"
 
 SERVER_PORT = 8080
+CLIENT_TIMEOUT = 10  # seconds a stalled client may hold the server
+VERBOSE = False  # print upload progress and per-request memory use
 # ==================================
 
 # Display Configuration
-DISPLAY_WIDTH = 800
-DISPLAY_HEIGHT = 480
-EXPECTED_BYTES_BW = (DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8  # 48,000 bytes (B&W)
-EXPECTED_BYTES_BWR = EXPECTED_BYTES_BW * 2  # 96,000 bytes (tri-color)
+DISPLAY_WIDTH = const(800)
+DISPLAY_HEIGHT = const(480)
+EXPECTED_BYTES_BW = const((DISPLAY_WIDTH * DISPLAY_HEIGHT) // 8)  # 48,000 bytes (B&W)
+EXPECTED_BYTES_BWR = const(EXPECTED_BYTES_BW * 2)  # 96,000 bytes (tri-color)
+
+# Frame buffer reserved once at boot, while the heap is still unfragmented;
+# every update is received (or inflated) straight into it
+FRAME_BUF = bytearray(EXPECTED_BYTES_BWR)
+
+# Responses never change, so they are encoded once at boot
+INFO_RESPONSE = f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} BWR".encode()
+OK_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK"
+TOO_LARGE_RESPONSE = b"HTTP/1.1 413 Payload Too Large\r\nContent-Length: 0\r\n\r\n"
+_CONTENT_LENGTH = b'content-length:'  # header names, matched against lower-cased lines
+_CONTENT_ENCODING = b'content-encoding:'
+
+# Clear pattern, built once at import. Kept to 1/48 of a plane: a full
+# 48 KB white plane would not fit alongside a 96 KB tri-color body.
+_WHITE = b'\xff' * 1000
 
 # Pin Configuration
 EPD_RST_PIN = 12
@@ -52,7 +70,7 @@ EPD_CS_PIN = 9
 EPD_BUSY_PIN = 13
 
 # SPI Configuration
-spi = SPI(1, baudrate=4000000, polarity=0, phase=0, 
+spi = SPI(1, baudrate=20000000, polarity=0, phase=0, 
           sck=Pin(10), mosi=Pin(11), miso=Pin(12))
 
 # Initialize pins
@@ -61,6 +79,41 @@ dc = Pin(EPD_DC_PIN, Pin.OUT)
 cs = Pin(EPD_CS_PIN, Pin.OUT)
 busy = Pin(EPD_BUSY_PIN, Pin.IN)
 
+# One-byte buffers reused by every command/register write
+_CMD_BUF = bytearray(1)
+_DATA_BUF = bytearray(1)
+
+# SPI1 registers and DREQ for DMA frame pushes (RP2040 datasheet 2.5.3, 4.4.4)
+_SPI1_SSPDR = const(0x40040008)
+_SPI1_SSPSR = const(0x4004000C)
+_SSPSR_BSY = const(0x10)
+_DREQ_SPI1_TX = const(18)
+
+# Frame pushes go through a DMA channel paced by the SPI TX DREQ, so the CPU
+# is free for a GC pass while the plane is clocked out. Falls back to a
+# blocking spi.write() on firmware without rp2.DMA (before MicroPython 1.22).
+try:
+    import rp2
+    _dma = rp2.DMA()
+    _DMA_CTRL = _dma.pack_ctrl(size=0, inc_read=True, inc_write=False,
+                               treq_sel=_DREQ_SPI1_TX)
+except (ImportError, AttributeError):
+    _dma = None
+
+# Init register writes, each a command byte followed by its data bytes
+_INIT_BEFORE_POWER_ON = (
+    b'\x01\x07\x07\x3F\x3F',  # Power setting
+    b'\x06\x17\x17\x28\x17',  # Booster soft start
+)
+_INIT_AFTER_POWER_ON = (
+    b'\x00\x1F',              # Panel setting
+    b'\x61\x03\x20\x01\xE0',  # Resolution 800x480
+    b'\x15\x00',              # Dual SPI off
+    b'\x50\x11\x07',          # VCOM and data interval
+    b'\x60\x22',              # TCON
+    b'\x22\xF7',
+)
+
 
 def show_memory():
     """Show current memory usage"""
@@ -79,11 +132,14 @@ def connect_wifi():
         print(f"Connecting to WiFi: {SSID}")
         wlan.connect(SSID, PASSWORD)
         
-        timeout = 10
-        while not wlan.isconnected() and timeout > 0:
+        # Probe quickly at first and back off, so a fast association is
+        # seen within ~100 ms instead of on the next whole second
+        delay = 0.1
+        deadline = time.ticks_add(time.ticks_ms(), 10000)
+        while not wlan.isconnected() and time.ticks_diff(deadline, time.ticks_ms()) > 0:
             print(".", end="")
-            time.sleep(1)
-            timeout -= 1
+            time.sleep(delay)
+            delay = min(2.0, delay * 1.6)
         print()
     
     if wlan.isconnected():
@@ -111,7 +167,8 @@ def epd_send_command(command):
     """Send command to e-paper display"""
     dc.value(0)
     cs.value(0)
-    spi.write(bytearray([command]))
+    _CMD_BUF[0] = command
+    spi.write(_CMD_BUF)
     cs.value(1)
 
 
@@ -119,7 +176,8 @@ def epd_send_data(data):
     """Send data to e-paper display"""
     dc.value(1)
     cs.value(0)
-    spi.write(bytearray([data]))
+    _DATA_BUF[0] = data
+    spi.write(_DATA_BUF)
     cs.value(1)
 
 
@@ -131,16 +189,70 @@ def epd_send_data_bytes(data):
     cs.value(1)
 
 
+def epd_send_white():
+    """Send one all-white plane as a single transaction from the 1 KB buffer"""
+    dc.value(1)
+    cs.value(0)
+    for i in range(0, EXPECTED_BYTES_BW, 1000):
+        spi.write(_WHITE)
+    cs.value(1)
+
+
+def epd_send_frame(data):
+    """Send a frame plane, running a GC pass while DMA transfers it"""
+    if _dma is None:
+        epd_send_data_bytes(data)
+        gc.collect()
+        return
+    dc.value(1)
+    cs.value(0)
+    _dma.config(read=data, write=_SPI1_SSPDR, count=len(data),
+                ctrl=_DMA_CTRL, trigger=True)
+    gc.collect()
+    while _dma.active():
+        pass
+    # DMA is done once the FIFO is fed; CS must stay low until it drains
+    while mem32[_SPI1_SSPSR] & _SSPSR_BSY:
+        pass
+    cs.value(1)
+
+
+def epd_send_blob(blob):
+    """Send a command byte and its data bytes in one CS transaction"""
+    mv = memoryview(blob)
+    dc.value(0)
+    cs.value(0)
+    spi.write(mv[:1])
+    dc.value(1)
+    spi.write(mv[1:])
+    cs.value(1)
+
+
+# Set by the BUSY falling-edge IRQ. epd_wait_busy() sleeps the core with
+# machine.idle() until it is set instead of polling the pin
+_busy_done = False
+
+
+def _busy_isr(pin):
+    global _busy_done
+    _busy_done = True
+
+
+busy.irq(trigger=Pin.IRQ_FALLING, handler=_busy_isr)
+
+
 def epd_wait_busy():
     """Wait until display is not busy"""
+    global _busy_done
+    _busy_done = False
     print("  Waiting for display ready...", end="")
-    timeout = 10
-    start = time.time()
-    while busy.value() == 1:
-        if time.time() - start > timeout:
-            print(" timeout")
-            return False
-        time.sleep_ms(100)
+    deadline = time.ticks_add(time.ticks_ms(), 10000)
+    if busy.value() == 1:  # else already idle, with no falling edge to come
+        while not _busy_done:
+            if time.ticks_diff(deadline, time.ticks_ms()) < 0:
+                print(" timeout")
+                return False
+            idle()
     print(" ✓")
     return True
 
@@ -161,51 +273,12 @@ def epd_init():
     epd_reset()
     epd_wait_busy()
     
-    # Panel setting
-    epd_send_command(0x01)
-    epd_send_data(0x07)
-    epd_send_data(0x07)
-    epd_send_data(0x3F)
-    epd_send_data(0x3F)
-    
-    # Power setting
-    epd_send_command(0x06)
-    epd_send_data(0x17)
-    epd_send_data(0x17)
-    epd_send_data(0x28)
-    epd_send_data(0x17)
-    
-    # Booster soft start
-    epd_send_command(0x04)
+    for blob in _INIT_BEFORE_POWER_ON:
+        epd_send_blob(blob)
+    epd_send_command(0x04)  # Power on
     epd_wait_busy()
-    
-    # Panel setting
-    epd_send_command(0x00)
-    epd_send_data(0x1F)
-    
-    # Resolution
-    epd_send_command(0x61)
-    epd_send_data(0x03)  # 800
-    epd_send_data(0x20)
-    epd_send_data(0x01)  # 480
-    epd_send_data(0xE0)
-    
-    # Dual SPI
-    epd_send_command(0x15)
-    epd_send_data(0x00)
-    
-    # VCOM
-    epd_send_command(0x50)
-    epd_send_data(0x11)
-    epd_send_data(0x07)
-    
-    # TCON
-    epd_send_command(0x60)
-    epd_send_data(0x22)
-    
-    # Display update control
-    epd_send_command(0x22)
-    epd_send_data(0xF7)
+    for blob in _INIT_AFTER_POWER_ON:
+        epd_send_blob(blob)
     
     print("✓ Display initialized")
 
@@ -228,33 +301,26 @@ def epd_display_image(image_data):
     
     # Clear old data
     print("  Clearing...")
-    white = bytearray([0xFF] * 1000)
-    
     epd_send_command(0x10)
-    for i in range(0, EXPECTED_BYTES_BW, 1000):
-        epd_send_data_bytes(white)
+    epd_send_white()
     
     epd_send_command(0x11)
-    for i in range(0, EXPECTED_BYTES_BW, 1000):
-        epd_send_data_bytes(white)
+    epd_send_white()
     
     # Write B&W data
     print("  Writing B&W data...")
     epd_send_command(0x13)
     
+    # Slice the planes through a memoryview so neither is copied
+    mv = memoryview(image_data)
     if is_bw:
         # B&W only - use all data
-        bw_data = image_data
+        bw_data = mv
     else:
         # Tri-color - use first half
-        bw_data = image_data[:EXPECTED_BYTES_BW]
+        bw_data = mv[:EXPECTED_BYTES_BW]
     
-    for i in range(0, len(bw_data), 1000):
-        chunk = bw_data[i:i+1000]
-        epd_send_data_bytes(chunk)
-        if i % 10000 == 0:
-            print(f"    {i*100//len(bw_data)}%")
-    print("    100%")
+    epd_send_frame(bw_data)
     
     # Write red data
     print("  Writing red data...")
@@ -262,17 +328,10 @@ def epd_display_image(image_data):
     
     if is_bwr:
         # Tri-color - use second half
-        red_data = image_data[EXPECTED_BYTES_BW:]
-        for i in range(0, len(red_data), 1000):
-            chunk = red_data[i:i+1000]
-            epd_send_data_bytes(chunk)
-            if i % 10000 == 0:
-                print(f"    {i*100//len(red_data)}%")
+        epd_send_frame(mv[EXPECTED_BYTES_BW:])
     else:
         # B&W only - write white to red channel
-        for i in range(0, EXPECTED_BYTES_BW, 1000):
-            epd_send_data_bytes(white)
-    print("    100%")
+        epd_send_white()
     
     # Refresh display
     print("  Refreshing (~15 sec)...")
@@ -293,73 +352,91 @@ def epd_sleep():
     print("  ✓ Display in deep sleep")
 
 
+def inflate(sock, out):
+    """Inflate a gzip body off the socket into out, returning the filled part"""
+    import deflate  # MicroPython 1.21+
+    stream = deflate.DeflateIO(sock, deflate.GZIP)
+    n = 0
+    while n < len(out):
+        r = stream.readinto(out[n:])
+        if not r:
+            break
+        n += r
+    return out[:n]
+
+
 def handle_request(conn, addr):
     """Handle HTTP request"""
     print(f"\n{'='*60}")
     print(f"Connection from {addr}")
-    show_memory()
+    if VERBOSE:
+        show_memory()
     
     try:
-        request = b""
+        # Request line, then headers one line at a time up to the blank
+        # line, so the body is never copied out of a header buffer
+        request = conn.readline()
         content_length = 0
-        headers_done = False
-        body = b""
-        
-        # Read headers
-        while not headers_done:
-            chunk = conn.recv(512)
-            if not chunk:
+        gzipped = False
+        while True:
+            line = conn.readline()
+            if not line:
+                return
+            if line == b'\r\n':
                 break
-            request += chunk
-            if b'\r\n\r\n' in request:
-                headers_done = True
-                header_end = request.find(b'\r\n\r\n')
-                headers = request[:header_end]
-                body = request[header_end + 4:]
-                
-                for line in headers.split(b'\r\n'):
-                    if line.startswith(b'Content-Length:'):
-                        content_length = int(line.split(b':')[1].strip())
-                        break
-                
-                if b'POST /update' not in headers:
-                    conn.send(f"HTTP/1.1 200 OK\r\n\r\nEINK {DISPLAY_WIDTH}x{DISPLAY_HEIGHT} BWR".encode())
-                    return
+            line = line.lower()
+            if line.startswith(_CONTENT_LENGTH):
+                content_length = int(line[15:].strip())
+            elif line.startswith(_CONTENT_ENCODING):
+                gzipped = b'gzip' in line
+        
+        if not request.startswith(b'POST /update'):
+            conn.send(INFO_RESPONSE)
+            return
         
-        if not headers_done or content_length == 0:
+        if content_length == 0:
             print("✗ Invalid request")
             return
         
         print(f"Receiving: {content_length} bytes...")
         
-        # Read remaining body
-        while len(body) < content_length:
-            remaining = content_length - len(body)
-            chunk = conn.recv(min(1024, remaining))
-            if not chunk:
-                break
-            body += chunk
+        # Server sends gzip when the display has 'compress': True. It is
+        # inflated straight off the socket into FRAME_BUF, so the compressed
+        # body is never buffered
+        if gzipped:
+            view = inflate(conn, memoryview(FRAME_BUF))
+            print(f"✓ Inflated to {len(view)} bytes")
+        elif content_length <= len(FRAME_BUF):
+            # Receive straight into the frame buffer
+            view = memoryview(FRAME_BUF)[:content_length]
+            offset = 0
+            while offset < content_length:
+                n = conn.readinto(view[offset:])
+                if not n:
+                    break
+                offset += n
+                
+                if VERBOSE and offset % 10000 == 0:
+                    print(f"  {offset*100//content_length}%")
+
+            if offset < content_length:
+                print(f"✗ Incomplete")
+                return
             
-            if len(body) % 10000 == 0:
-                print(f"  {len(body)*100//content_length}%")
-        
-        if len(body) < content_length:
-            print(f"✗ Incomplete")
+            print(f"✓ Received")
+        else:
+            print(f"✗ Invalid size: {content_length} bytes")
+            conn.send(TOO_LARGE_RESPONSE)
             return
         
-        print(f"✓ Received")
-        
         # Send response
-        response = "HTTP/1.1 200 OK\r\n\r\nOK"
-        conn.send(response.encode())
+        conn.send(OK_RESPONSE)
         
         # Clean up
         del request
-        del headers
-        gc.collect()
         
         # Display image
-        epd_display_image(body)
+        epd_display_image(view)
         
         # Wait for display to stabilize
         print("  Waiting for display to stabilize...")
@@ -369,11 +446,11 @@ def handle_request(conn, addr):
         epd_sleep()
         
         # Clean up
-        del body
-        gc.collect()
+        del view
         
         print("✓ Complete!")
-        show_memory()
+        if VERBOSE:
+            show_memory()
         print(f"{'='*60}\n")
         
     except MemoryError as e:
@@ -386,7 +463,6 @@ def handle_request(conn, addr):
             conn.close()
         except:
             pass
-        gc.collect()
 
 
 def start_server():
@@ -396,6 +472,9 @@ def start_server():
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(addr)
     s.listen(1)
+    # Flush each small response at once instead of letting Nagle hold it
+    # back (the option is missing on older MicroPython builds)
+    nodelay = hasattr(socket, 'TCP_NODELAY')
     
     print(f"\n{'='*60}")
     print("✓ Server running")
@@ -406,8 +485,10 @@ def start_server():
     while True:
         try:
             conn, addr = s.accept()
+            conn.settimeout(CLIENT_TIMEOUT)
+            if nodelay:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             handle_request(conn, addr)
-            gc.collect()
         except Exception as e:
             print(f"✗ {e}")
             gc.collect()
@@ -428,6 +509,9 @@ def main():
         print("\n✗ Cannot start without WiFi")
         return
     
+    # Collect on allocation pressure rather than explicitly on every request
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+    
     try:
         epd_init()
     except Exception as e: